@@ -7,7 +7,7 @@ import inspect
 import sys
 import threading
 from collections.abc import Iterable, Iterator, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from textwrap import dedent
 from typing import (
@@ -41,7 +41,7 @@ else:
 from collections.abc import Sequence  # noqa: TC003
 
 from marimo import _loggers
-from marimo._ast.cell import Cell, CellConfig, CellImpl
+from marimo._ast.cell import Cell, CellConfig
 from marimo._ast.cell_manager import CellManager
 from marimo._ast.errors import (
     CycleError,
@@ -70,6 +70,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from types import FrameType, TracebackType
 
+    from marimo._ast.visitor import Name
     from marimo._messaging.ops import HumanReadableStatus
     from marimo._plugins.core.web_component import JSONType
     from marimo._runtime.context.types import ExecutionContext
@@ -232,6 +233,11 @@ class App:
         self._pytest_rewrite = False
         # setup context for script mode and module imports
         self._setup: Optional[_SetupContext] = None
+        # (cell manager, cell manager version, allowed refs), see
+        # InternalApp.allowed_refs
+        self._allowed_refs: Optional[
+            tuple[CellManager, int, frozenset[Name]]
+        ] = None
 
         # Filename is derived from the callsite of the app
         # unless explicitly set (e.g. for static loading case)
@@ -274,9 +280,7 @@ class App:
                 if cell is not None:
                     new_cell = Cell(
                         _name=cell.name,
-                        _cell=CellImpl(
-                            **{**cell._cell.__dict__, "cell_id": new_cell_id}
-                        ),
+                        _cell=replace(cell._cell, cell_id=new_cell_id),
                         _app=InternalApp(app),
                     )
                     app._cell_manager.register_cell(
@@ -753,6 +757,29 @@ class InternalApp:
     def update_config(self, updates: dict[str, Any]) -> _AppConfig:
         return self.config.update(updates)
 
+    def allowed_refs(self) -> frozenset[Name]:
+        """Top-level names that cells can reference without taking them as
+        arguments.
+
+        Memoized until the app's cells change.
+        """
+        from marimo._ast.toplevel import TopLevelExtraction
+
+        cell_manager = self._app._cell_manager
+        cached = self._app._allowed_refs
+        if (
+            cached is None
+            or cached[0] is not cell_manager
+            or cached[1] != cell_manager.version
+        ):
+            cached = (
+                cell_manager,
+                cell_manager.version,
+                frozenset(TopLevelExtraction.from_app(self).allowed_refs),
+            )
+            self._app._allowed_refs = cached
+        return cached[2]
+
     def inline_layout_file(self) -> InternalApp:
         if self.config.layout_file:
             layout_path = Path(self.config.layout_file)
@@ -5,18 +5,23 @@ import ast
 import dataclasses
 import inspect
 import os
+import sys
 from collections.abc import Awaitable, Mapping
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from marimo import _loggers
 from marimo._ast.sql_visitor import SQLVisitor
 from marimo._ast.visitor import ImportData, Language, Name, VariableData
+from marimo._runtime.context import ContextNotInitializedError, get_context
 from marimo._runtime.exceptions import MarimoRuntimeException
 from marimo._types.ids import CellId_t
-from marimo._utils.deep_merge import deep_merge
 
 LOGGER = _loggers.marimo_logger()
 
+# Slotted dataclasses drop the per-instance __dict__; notebooks allocate
+# several of these per cell. The `slots` argument requires Python 3.10+.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from types import CodeType
@@ -26,7 +31,7 @@ if TYPE_CHECKING:
     from marimo._output.hypertext import Html
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_SLOTS)
 class CellConfig:
     """
     Internal representation of a cell's configuration.
@@ -46,21 +51,24 @@ class CellConfig:
     def from_dict(
         cls, kwargs: dict[str, Any], warn: bool = True
     ) -> CellConfig:
-        config = cls(
-            **{k: v for k, v in kwargs.items() if k in CellConfigKeys}
-        )
-        if warn and (invalid := set(kwargs.keys()) - CellConfigKeys):
-            LOGGER.warning(f"Invalid config keys: {invalid}")
-        return config
+        if kwargs.keys() <= CellConfigKeys:
+            return cls(**kwargs)
+        if warn:
+            LOGGER.warning(
+                f"Invalid config keys: {kwargs.keys() - CellConfigKeys}"
+            )
+        return cls(**{k: kwargs[k] for k in kwargs.keys() & CellConfigKeys})
 
     def asdict(self) -> dict[str, Any]:
-        return dataclasses.asdict(self)
+        # All fields are scalars, so dataclasses.asdict's deep copy is not
+        # needed; iterate the defaults table to keep field order.
+        return {k: getattr(self, k) for k in _CELL_CONFIG_DEFAULTS}
 
     def asdict_without_defaults(self) -> dict[str, Any]:
         return {
             k: v
-            for k, v in self.asdict().items()
-            if v != getattr(CellConfig(), k)
+            for k, default in _CELL_CONFIG_DEFAULTS.items()
+            if (v := getattr(self, k)) != default
         }
 
     def is_different_from_default(self) -> bool:
@@ -72,18 +80,25 @@ class CellConfig:
         `update` can be a partial config or a CellConfig
         """
         if isinstance(update, CellConfig):
-            update = dataclasses.asdict(update)
-        new_config = dataclasses.asdict(
-            CellConfig.from_dict(deep_merge(dataclasses.asdict(self), update))
-        )
-        for key, value in new_config.items():
-            self.__setattr__(key, value)
+            for key in CellConfigKeys:
+                setattr(self, key, getattr(update, key))
+            return
+        if invalid := update.keys() - CellConfigKeys:
+            LOGGER.warning(f"Invalid config keys: {invalid}")
+        # All fields are scalars, so there is nothing to merge recursively.
+        for key in update.keys() & CellConfigKeys:
+            setattr(self, key, update[key])
 
 
 CellConfigKeys = frozenset(
     {field.name for field in dataclasses.fields(CellConfig)}
 )
 
+# Field name -> default value, in field order
+_CELL_CONFIG_DEFAULTS: dict[str, Any] = {
+    field.name: field.default for field in dataclasses.fields(CellConfig)
+}
+
 
 # States in a cell's runtime state machine
 #
@@ -96,11 +111,6 @@ RuntimeStateType = Literal[
 ]
 
 
-@dataclasses.dataclass
-class RuntimeState:
-    state: Optional[RuntimeStateType] = None
-
-
 # Statuses for a cell's attempted execution
 #
 # cancelled:    an ancestor raised an exception
@@ -116,12 +126,7 @@ RunResultStatusType = Literal[
 ]
 
 
-@dataclasses.dataclass
-class RunResultStatus:
-    state: Optional[RunResultStatusType] = None
-
-
-@dataclasses.dataclass
+@dataclasses.dataclass(**_SLOTS)
 class ImportWorkspace:
     """A workspace for runtimes to use to manage a cell's imports."""
 
@@ -131,41 +136,51 @@ class ImportWorkspace:
     imported_defs: set[Name] = dataclasses.field(default_factory=set)
 
 
+def _is_pytest() -> bool:
+    # Not cached: PYTEST_CURRENT_TEST is set per test, and
+    # MARIMO_PYTEST_WASM is toggled around in-notebook pytest runs.
+    return (
+        "PYTEST_CURRENT_TEST" in os.environ
+        or "MARIMO_PYTEST_WASM" in os.environ
+    )
+
+
 def _is_coroutine(code: Optional[CodeType]) -> bool:
     if code is None:
         return False
     return inspect.CO_COROUTINE & code.co_flags == inspect.CO_COROUTINE
 
 
-@dataclasses.dataclass
-class CellStaleState:
-    state: bool = False
-
+@dataclasses.dataclass(**_SLOTS)
+class _CellMutable:
+    """Mutable state of a (frozen) CellImpl, kept in a single object."""
 
-@dataclasses.dataclass
-class CellOutput:
+    # execution status, inferred at runtime
+    status: Optional[RuntimeStateType] = None
+    run_result_status: Optional[RunResultStatusType] = None
+    # whether the cell is stale, inferred at runtime
+    stale: bool = False
+    # cells can optionally hold a reference to their output
     output: Any = None
+    # parsed sql statements
+    sqls: Optional[list[str]] = None
+    raw_sqls: Optional[list[str]] = None
 
 
-@dataclasses.dataclass
-class ParsedSQLStatements:
-    parsed: Optional[list[str]] = None
-
-
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_SLOTS)
 class CellImpl:
     # hash of code
     key: int
     code: str
     mod: ast.Module
-    defs: set[Name]
-    refs: set[Name]
+    defs: frozenset[Name]
+    refs: frozenset[Name]
     # Variables that should only live for the duration of the cell
-    temporaries: set[Name]
+    temporaries: frozenset[Name]
 
     # metadata about definitions
     variable_data: dict[Name, list[VariableData]]
-    deleted_refs: set[Name]
+    deleted_refs: frozenset[Name]
     body: Optional[CodeType]
     last_expr: Optional[CodeType]
     # whether this cell is Python or SQL
@@ -173,32 +188,74 @@ class CellImpl:
     # unique id
     cell_id: CellId_t
 
-    # Mutable fields
+    # Mutable fields; excluded from equality, and the runtime state (which
+    # can hold a large output) from repr.
     # explicit configuration of cell
-    config: CellConfig = dataclasses.field(default_factory=CellConfig)
+    config: CellConfig = dataclasses.field(
+        default_factory=CellConfig, compare=False
+    )
     # workspace for runtimes to use to store metadata about imports
     import_workspace: ImportWorkspace = dataclasses.field(
-        default_factory=ImportWorkspace
+        default_factory=ImportWorkspace, repr=False, compare=False
     )
-    # execution status, inferred at runtime
-    _status: RuntimeState = dataclasses.field(default_factory=RuntimeState)
-    _run_result_status: RunResultStatus = dataclasses.field(
-        default_factory=RunResultStatus
-    )
-    # whether the cell is stale, inferred at runtime
-    _stale: CellStaleState = dataclasses.field(default_factory=CellStaleState)
-    # cells can optionally hold a reference to their output
-    _output: CellOutput = dataclasses.field(default_factory=CellOutput)
-    # parsed sql statements
-    _sqls: ParsedSQLStatements = dataclasses.field(
-        default_factory=ParsedSQLStatements
-    )
-    _raw_sqls: ParsedSQLStatements = dataclasses.field(
-        default_factory=ParsedSQLStatements
+    # runtime status, staleness, output, and parsed sql statements
+    _mutable: _CellMutable = dataclasses.field(
+        default_factory=_CellMutable, repr=False, compare=False
     )
     # Whether this cell can be executed as a test cell.
     _test: bool = False
 
+    # Derived from variable_data in __post_init__
+    _imports: tuple[ImportData, ...] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _imported_namespaces: frozenset[Name] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _namespace_to_variable: dict[str, Name] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _init_variable_data: dict[Name, VariableData] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    # Derived from the compiled code in __post_init__
+    _is_coro: bool = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        imports = tuple(
+            datum.import_data
+            for data in self.variable_data.values()
+            for datum in data
+            if datum.import_data is not None
+        )
+        namespace_to_variable: dict[str, Name] = {}
+        for import_data in imports:
+            namespace_to_variable.setdefault(
+                import_data.namespace, import_data.definition
+            )
+        # CellImpl is frozen, so cached values are set with object.__setattr__
+        object.__setattr__(self, "_imports", imports)
+        object.__setattr__(
+            self,
+            "_imported_namespaces",
+            frozenset(
+                import_data.module.split(".")[0] for import_data in imports
+            ),
+        )
+        object.__setattr__(
+            self, "_namespace_to_variable", namespace_to_variable
+        )
+        object.__setattr__(
+            self,
+            "_init_variable_data",
+            {key: vs[0] for key, vs in self.variable_data.items()},
+        )
+        object.__setattr__(
+            self,
+            "_is_coro",
+            _is_coroutine(self.body) or _is_coroutine(self.last_expr),
+        )
+
     def configure(self, update: dict[str, Any] | CellConfig) -> CellImpl:
         """Update the cell config.
 
@@ -219,16 +276,18 @@ class CellImpl:
                 - "disabled-transitively": cell is disabled because a parent is disabled
                 - None: state not set
         """
-        return self._status.state
+        return self._mutable.status
 
     @property
     def run_result_status(self) -> Optional[RunResultStatusType]:
-        return self._run_result_status.state
+        return self._mutable.run_result_status
 
     def _get_sqls(self, raw: bool = False) -> list[str]:
         try:
             visitor = SQLVisitor(raw=raw)
-            visitor.visit(ast.parse(self.code))
+            # Raw statements are unparsed verbatim, so they need the user's
+            # source; `mod` has cell-local names mangled.
+            visitor.visit(ast.parse(self.code) if raw else self.mod)
             return visitor.get_sqls()
         except Exception:
             return []
@@ -240,11 +299,11 @@ class CellImpl:
         Returns:
             list[str]: List of SQL statement strings parsed from the cell code.
         """
-        if self._sqls.parsed is not None:
-            return self._sqls.parsed
+        if self._mutable.sqls is not None:
+            return self._mutable.sqls
 
-        self._sqls.parsed = self._get_sqls()
-        return self._sqls.parsed
+        self._mutable.sqls = self._get_sqls()
+        return self._mutable.sqls
 
     @property
     def raw_sqls(self) -> list[str]:
@@ -253,15 +312,15 @@ class CellImpl:
         Returns:
             list[str]: List of SQL statements verbatim from the cell code.
         """
-        if self._raw_sqls.parsed is not None:
-            return self._raw_sqls.parsed
+        if self._mutable.raw_sqls is not None:
+            return self._mutable.raw_sqls
 
-        self._raw_sqls.parsed = self._get_sqls(raw=True)
-        return self._raw_sqls.parsed
+        self._mutable.raw_sqls = self._get_sqls(raw=True)
+        return self._mutable.raw_sqls
 
     @property
     def stale(self) -> bool:
-        return self._stale.state
+        return self._mutable.stale
 
     @property
     def disabled_transitively(self) -> bool:
@@ -270,23 +329,12 @@ class CellImpl:
     @property
     def imports(self) -> Iterable[ImportData]:
         """Return a set of import data for this cell."""
-        import_data = []
-        for data in self.variable_data.values():
-            import_data.extend(
-                [
-                    datum.import_data
-                    for datum in data
-                    if datum.import_data is not None
-                ]
-            )
-        return import_data
+        return self._imports
 
     @property
-    def imported_namespaces(self) -> set[Name]:
+    def imported_namespaces(self) -> frozenset[Name]:
         """Return a set of the namespaces imported by this cell."""
-        return set(
-            import_data.module.split(".")[0] for import_data in self.imports
-        )
+        return self._imported_namespaces
 
     def namespace_to_variable(self, namespace: str) -> Name | None:
         """Returns the variable name corresponding to an imported namespace
@@ -297,21 +345,15 @@ class CellImpl:
 
         In this case the namespace is "matplotlib" but the name is "plt".
         """
-        for import_data in self.imports:
-            if import_data.namespace == namespace:
-                return import_data.definition
-        return None
+        return self._namespace_to_variable.get(namespace)
 
     def is_coroutine(self) -> bool:
-        return _is_coroutine(self.body) or _is_coroutine(self.last_expr)
+        return self._is_coro
 
     @property
     def toplevel_variable(self) -> Optional[VariableData]:
         """Return the single, scoped, toplevel variable defined if found."""
-        try:
-            tree = ast.parse(self.code)
-        except SyntaxError:
-            return None
+        tree = self.mod
 
         if len(self.defs) != 1:
             return None
@@ -327,17 +369,18 @@ class CellImpl:
 
         # Check that def matches the single definition
         name = tree.body[0].name
-        if not (name == list(self.defs)[0] and name in self.variable_data):
+        if not (name in self.defs and name in self.variable_data):
             return None
 
         if len(variable_data := self.variable_data[name]) != 1:
             return None
 
-        return list(variable_data)[0]
+        return variable_data[0]
 
     @property
     def init_variable_data(self) -> dict[Name, VariableData]:
-        return {key: vs[0] for key, vs in self.variable_data.items()}
+        """The first definition of each variable; shared, do not mutate."""
+        return self._init_variable_data
 
     def set_runtime_state(
         self, status: RuntimeStateType, stream: Stream | None = None
@@ -348,18 +391,15 @@ class CellImpl:
             status (RuntimeStateType): New runtime state to set
             stream (Stream | None, optional): Stream to broadcast on. Defaults to None.
         """
-        from marimo._messaging.ops import CellOp
-        from marimo._runtime.context import (
-            ContextNotInitializedError,
-            get_context,
-        )
-
-        self._status.state = status
+        self._mutable.status = status
         try:
             get_context()
         except ContextNotInitializedError:
             return
 
+        # Deferred: marimo._messaging.ops imports this module.
+        from marimo._messaging.ops import CellOp
+
         assert self.cell_id is not None
         CellOp.broadcast_status(
             cell_id=self.cell_id, status=status, stream=stream
@@ -368,27 +408,29 @@ class CellImpl:
     def set_run_result_status(
         self, run_result_status: RunResultStatusType
     ) -> None:
-        self._run_result_status.state = run_result_status
+        self._mutable.run_result_status = run_result_status
 
     def set_stale(
         self, stale: bool, stream: Stream | None = None, broadcast: bool = True
     ) -> None:
-        from marimo._messaging.ops import CellOp
-
-        self._stale.state = stale
+        self._mutable.stale = stale
         if broadcast:
+            from marimo._messaging.ops import CellOp
+
             CellOp.broadcast_stale(
                 cell_id=self.cell_id, stale=stale, stream=stream
             )
 
     def set_output(self, output: Any) -> None:
-        self._output.output = output
+        self._mutable.output = output
 
     @property
     def output(self) -> Any:
-        return self._output.output
+        return self._mutable.output
 
 
+# Not slotted: pytest integration decorates cells with `functools.wraps`,
+# which needs an instance `__dict__`.
 @dataclasses.dataclass
 class Cell:
     """An executable notebook cell
@@ -450,17 +492,27 @@ class Cell:
 
     _expected_signature: Optional[tuple[str, ...]] = None
 
+    # Cached result of `_is_coroutine`, computed on first access
+    _is_coro_cached: Optional[bool] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Cached result of `_arg_names`, keyed by the app's allowed refs
+    _arg_names_cached: Optional[tuple[frozenset[Name], tuple[Name, ...]]] = (
+        dataclasses.field(default=None, init=False, repr=False, compare=False)
+    )
+
     @property
     def name(self) -> str:
         return self._name
 
     @property
-    def refs(self) -> set[str]:
+    def refs(self) -> frozenset[str]:
         """The references that this cell takes as input"""
         return self._cell.refs
 
     @property
-    def defs(self) -> set[str]:
+    def defs(self) -> frozenset[str]:
         """The definitions made by this cell"""
         return self._cell.defs
 
@@ -470,10 +522,10 @@ class Cell:
 
         If True, then this cell's `run` method returns an awaitable.
         """
-        if hasattr(self, "_is_coro_cached"):
+        if self._is_coro_cached is not None:
             return self._is_coro_cached
         assert self._app is not None
-        self._is_coro_cached: bool = self._app.runner.is_coroutine(
+        self._is_coro_cached = self._app.runner.is_coroutine(
             self._cell.cell_id
         )
         return self._is_coro_cached
@@ -638,14 +690,14 @@ class Cell:
 
         # Inject setup cell definitions so that we do not rerun the setup cell.
         # With an exception for tests that should act as if it's in runtime.
-        if "PYTEST_CURRENT_TEST" not in os.environ:
-            if self._app._app._setup is not None:
-                from_setup = {
-                    k: v
-                    for k, v in self._app._app._setup._glbls.items()
-                    if k in self._cell.refs
-                }
-                refs = {**from_setup, **refs}
+        if (
+            self._app._app._setup is not None
+            and "PYTEST_CURRENT_TEST" not in os.environ
+        ):
+            # A cell's refs are typically far fewer than the setup globals.
+            glbls = self._app._app._setup._glbls
+            from_setup = {k: glbls[k] for k in self._cell.refs if k in glbls}
+            refs = {**from_setup, **refs}
 
         try:
             if self._is_coroutine:
@@ -655,19 +707,34 @@ class Cell:
         except MarimoRuntimeException as e:
             raise e.__cause__ from None  # type: ignore
 
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        from marimo._ast.toplevel import TopLevelExtraction
-
+    def _arg_names(self) -> tuple[Name, ...]:
+        """The sorted argument names of this cell when called directly."""
         assert self._app is not None
+        app_allowed_refs = self._app.allowed_refs()
+        cached = self._arg_names_cached
+        if cached is not None and cached[0] is app_allowed_refs:
+            return cached[1]
+
         # Definitions on a module level are not part of the signature, and as
         # such, should not be provided with the call.
 
         # NB. TopLevelExtraction assumes that all cells that can be exposed will
         # be, but signature provides context for what is actually scoped.
-        allowed_refs = TopLevelExtraction.from_app(self._app).allowed_refs
-        allowed_refs -= set(self._expected_signature or ())
+        allowed_refs = app_allowed_refs - set(self._expected_signature or ())
+        defs = self._cell.defs
+        arg_names = tuple(
+            sorted(
+                ref
+                for ref in self._cell.refs
+                if ref not in allowed_refs and ref not in defs
+            )
+        )
+        self._arg_names_cached = (app_allowed_refs, arg_names)
+        return arg_names
 
-        arg_names = sorted((self._cell.refs - allowed_refs) - self._cell.defs)
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        assert self._app is not None
+        arg_names = self._arg_names()
         argc = len(arg_names)
 
         call_args = {name: arg for name, arg in zip(arg_names, args)}
@@ -679,10 +746,6 @@ class Cell:
                 f"{self.name}() got an unexpected argument(s) '{unexpected}'"
             )
 
-        is_pytest = (
-            "PYTEST_CURRENT_TEST" in os.environ
-            or "MARIMO_PYTEST_WASM" in os.environ
-        )
         # Capture pytest case, where arguments don't match the references.
         if self._pytest_reserved - set(arg_names):
             raise TypeError(
@@ -694,10 +757,10 @@ class Cell:
 
         mismatch_context = ""
         if self._expected_signature is not None:
-            if tuple(arg_names) != self._expected_signature:
+            if arg_names != self._expected_signature:
                 mismatch_context = (
                     f"The signature of function ``{self._name}'': {self._expected_signature} "
-                    f"does not match the expected signature: {tuple(arg_names)}. "
+                    f"does not match the expected signature: {arg_names}. "
                     "A mismatch in arguments likely means you should "
                     "resave the notebook in the marimo editor."
                 )
@@ -709,11 +772,11 @@ class Cell:
         # pytest is an exception here, since it enables testing directly on
         # notebooks, and the graph will be executed if needed.
         if argc == call_argc and (
-            is_pytest
-            or (
+            (
                 all(name in call_args for name in arg_names)
                 and argc == actual_count
             )
+            or _is_pytest()
         ):
             # Function invoked successfully, but let the user know there is a
             # mismatch in the signature.
@@ -733,7 +796,7 @@ class Cell:
                 output, _ = ret
             return output
 
-        if is_pytest:
+        if _is_pytest():
             call_str = mismatch_context
         else:
             await_str = "await " if self._is_coroutine else ""
@@ -750,7 +813,7 @@ class Cell:
         )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_SLOTS)
 class SourcePosition:
     filename: str
     lineno: int
@@ -102,6 +102,8 @@ class CellManager:
         self.prefix = prefix
         self.unparsable = False
         self._cell_id_generator = CellIdGenerator(prefix)
+        # Incremented whenever cells are registered or re-keyed
+        self._version = 0
 
     def create_cell_id(self) -> CellId_t:
         """Create a new unique cell ID.
@@ -246,6 +248,7 @@ class CellManager:
             config=config or CellConfig(),
             cell=cell,
         )
+        self._version += 1
 
     def register_ir_cell(
         self, cell_def: CellDef, app: InternalApp | None = None
@@ -522,6 +525,7 @@ class CellManager:
             new_cell_data[new_id] = prev_cell_data
 
         self._cell_data = new_cell_data
+        self._version += 1
 
         # Add the new ids to the set, so we don't reuse them in the future
         for _id in sorted_ids:
@@ -531,6 +535,11 @@ class CellManager:
     def seen_ids(self) -> set[CellId_t]:
         return self._cell_id_generator.seen_ids
 
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever the registered cells change."""
+        return self._version
+
 
 def _match_cell_ids_by_similarity(
     prev_ids: list[CellId_t],
@@ -126,19 +126,20 @@ def to_decorator(
 
     # Removed defaults. If the cell's config is the default config,
     # don't include it in the decorator.
-    if not config.disabled:
-        del config.disabled
-    if not config.hide_code:
-        del config.hide_code
-    if not isinstance(config.column, int):
-        del config.column
-
-    if config == CellConfig():
+    kwargs: dict[str, Any] = {}
+    if isinstance(config.column, int):
+        kwargs["column"] = config.column
+    if config.disabled:
+        kwargs["disabled"] = config.disabled
+    if config.hide_code:
+        kwargs["hide_code"] = config.hide_code
+
+    if not kwargs:
         return f"@app.{fn}"
     else:
         return format_tuple_elements(
             f"@app.{fn}(...)",
-            tuple(f"{key}={value}" for key, value in config.__dict__.items()),
+            tuple(f"{key}={value}" for key, value in kwargs.items()),
         )
 
 
@@ -288,7 +289,7 @@ def generate_unparsable_cell(
 
     flags = {}
     if config != CellConfig():
-        flags = dict(config.__dict__)
+        flags = config.asdict()
 
     if name is not None:
         flags["name"] = name
@@ -173,11 +173,11 @@ def compile_cell(
             key=hash(""),
             code=code,
             mod=module,
-            defs=set(),
-            refs=set(),
-            temporaries=set(),
+            defs=frozenset(),
+            refs=frozenset(),
+            temporaries=frozenset(),
             variable_data={},
-            deleted_refs=set(),
+            deleted_refs=frozenset(),
             language="python",
             body=None,
             last_expr=None,
@@ -275,15 +275,15 @@ def compile_cell(
         key=code_key(code),
         code=code,
         mod=original_module,
-        defs=nonlocals,
-        refs=v.refs,
-        temporaries=temporaries,
+        defs=frozenset(nonlocals),
+        refs=frozenset(v.refs),
+        temporaries=frozenset(temporaries),
         variable_data=variable_data,
         import_workspace=ImportWorkspace(
             is_import_block=is_import_block,
             imported_defs=imported_defs,
         ),
-        deleted_refs=v.deleted_refs,
+        deleted_refs=frozenset(v.deleted_refs),
         language=v.language,
         body=body,
         last_expr=last_expr,
@@ -13,7 +13,7 @@ from marimo._ast.cell import Cell
 from marimo._runtime.context import ContextNotInitializedError, get_context
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Mapping
+    from collections.abc import Awaitable, Collection, Mapping
 
 Fn = TypeVar("Fn", bound=Callable[..., Any])
 
@@ -124,7 +124,7 @@ def build_test_class(
     ],
     file: str,
     name: str,
-    defs: set[str],
+    defs: Collection[str],
     inner: bool = False,
 ) -> type[MarimoTest]:
     """
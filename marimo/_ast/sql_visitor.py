@@ -12,6 +12,9 @@ from marimo._dependencies.dependencies import DependencyManager
 
 LOGGER = _loggers.marimo_logger()
 
+# End of a non-quoted token: whitespace or the start of a comment
+TOKEN_END_REGEX = re.compile(r"[\s\-/]")
+
 
 class SQLVisitor(ast.NodeVisitor):
     """
@@ -104,10 +107,8 @@ class TokenExtractor:
             end = sql_statement.find("'", start + 1) + 1
         else:
             # For non-quoted tokens, find until space or comment
-            maybe_end = re.search(r"[\s\-/]", sql_statement[start:])
-            end = (
-                start + maybe_end.start() if maybe_end else len(sql_statement)
-            )
+            maybe_end = TOKEN_END_REGEX.search(sql_statement, start)
+            end = maybe_end.start() if maybe_end else len(sql_statement)
             if i + 1 < len(tokens):
                 # For tokens squashed together e.g. '(select' or 'x);;'
                 # in (select * from x);;
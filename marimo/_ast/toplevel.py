@@ -21,7 +21,7 @@ from marimo._runtime.dataflow import DirectedGraph
 from marimo._types.ids import CellId_t
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Collection, Iterator
 
 # Constant for easy reuse in tests.
 # The formatting here affects how the error is rendered in the frontend.
@@ -169,7 +169,7 @@ class TopLevelStatus:
         defined_refs = dependent_refs - potential_refs
         if not (defined_refs):
             self.type = TopLevelType.UNRESOLVED
-            self.dependencies = dependent_refs
+            self.dependencies = set(dependent_refs)
             return
 
         self.demote(HINT_HAS_REFS.format(defined_refs))
@@ -179,15 +179,15 @@ class TopLevelStatus:
         self.hint = hint
 
     @property
-    def defs(self) -> set[Name]:
+    def defs(self) -> frozenset[Name]:
         if self._cell is None:
-            return set()
+            return frozenset()
         return self._cell.defs
 
     @property
-    def refs(self) -> set[Name]:
+    def refs(self) -> frozenset[Name]:
         if self._cell is None:
-            return set()
+            return frozenset()
         return self._cell.refs
 
     @property
@@ -224,7 +224,7 @@ class TopLevelExtraction:
         codes: list[str],
         names: list[str],
         cell_configs: list[CellConfig],
-        toplevel_defs: set[Name],
+        toplevel_defs: Collection[Name],
     ):
         self.statuses: list[TopLevelStatus] = []
 
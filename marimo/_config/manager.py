@@ -24,6 +24,7 @@ from marimo._config.config import (
 )
 from marimo._config.packages import PackageManagerKind
 from marimo._config.reader import (
+    file_stat_key,
     find_nearest_pyproject_toml,
     get_marimo_config_from_pyproject_dict,
     read_marimo_config,
@@ -35,6 +36,7 @@ from marimo._config.secrets import (
     remove_secret_placeholders,
 )
 from marimo._config.utils import (
+    deep_copy,
     get_or_create_user_config_path,
 )
 
@@ -300,6 +302,10 @@ class ScriptConfigManager(PartialMarimoConfigReader):
 
     def __init__(self, filename: Optional[str]) -> None:
         self.filename = filename
+        # The script's config, tagged with the stat key it was read at
+        self._cache: Optional[
+            tuple[tuple[int, int], Optional[PartialMarimoConfig]]
+        ] = None
 
     def get_config(self, *, hide_secrets: bool = True) -> PartialMarimoConfig:
         if self.filename is None:
@@ -309,18 +315,16 @@ class ScriptConfigManager(PartialMarimoConfigReader):
             if not filepath.is_file():
                 return {}
 
-            from marimo._utils.scripts import read_pyproject_from_script
-
-            script_content = filepath.read_text(encoding="utf-8")
-            script_config = read_pyproject_from_script(script_content)
-            if script_config is None:
-                return {}
-
-            marimo_config = get_marimo_config_from_pyproject_dict(
-                script_config
-            )
+            key = file_stat_key(filepath)
+            if key is not None and self._cache and self._cache[0] == key:
+                marimo_config = self._cache[1]
+            else:
+                marimo_config = self._read_script_config(filepath)
+                if key is not None:
+                    self._cache = (key, marimo_config)
             if marimo_config is None:
                 return {}
+            marimo_config = cast(PartialMarimoConfig, deep_copy(marimo_config))
 
         except Exception as e:
             LOGGER.warning("Failed to read script config: %s", e)
@@ -330,6 +334,17 @@ class ScriptConfigManager(PartialMarimoConfigReader):
             return mask_secrets_partial(marimo_config)
         return marimo_config
 
+    @staticmethod
+    def _read_script_config(filepath: Path) -> Optional[PartialMarimoConfig]:
+        from marimo._utils.scripts import read_pyproject_from_script
+
+        script_content = filepath.read_text(encoding="utf-8")
+        script_config = read_pyproject_from_script(script_content)
+        if script_config is None:
+            return None
+
+        return get_marimo_config_from_pyproject_dict(script_config)
+
 
 class UserConfigManager(MarimoConfigReader):
     """Read and write the user configuration"""
@@ -1,26 +1,56 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union, cast
 
 from marimo import _loggers
 from marimo._config.config import PartialMarimoConfig
+from marimo._config.utils import deep_copy
 from marimo._utils.toml import read_toml
 
 LOGGER = _loggers.marimo_logger()
 
 
+def file_stat_key(path: Union[str, Path]) -> Optional[tuple[int, int]]:
+    """The (mtime_ns, size) of a file, or None if it can't be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Config is read on every request, but rarely changes; a changed file has a
+# new stat key, so stale entries are never hit and age out of the cache
+@lru_cache(maxsize=32)
+def _parse_toml(path: Path, stat_key: tuple[int, int]) -> dict[str, Any]:
+    del stat_key
+    return read_toml(path)
+
+
+def _read_toml_cached(path: Union[str, Path]) -> dict[str, Any]:
+    # Resolve, so a relative path is cached as the file it names right now
+    resolved = Path(path).resolve()
+    key = file_stat_key(resolved)
+    if key is None:
+        return read_toml(path)
+    # Callers may mutate the result
+    return cast(dict[str, Any], deep_copy(_parse_toml(resolved, key)))
+
+
 def read_marimo_config(path: str) -> PartialMarimoConfig:
     """Read the marimo.toml configuration."""
-    return cast(PartialMarimoConfig, read_toml(path))
+    return cast(PartialMarimoConfig, _read_toml_cached(path))
 
 
 def read_pyproject_marimo_config(
     pyproject_path: Union[str, Path],
 ) -> Optional[PartialMarimoConfig]:
     """Read the marimo tool config from a pyproject.toml file."""
-    pyproject_config = read_toml(pyproject_path)
+    pyproject_config = _read_toml_cached(pyproject_path)
     marimo_tool_config = get_marimo_config_from_pyproject_dict(
         pyproject_config
     )
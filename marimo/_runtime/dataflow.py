@@ -376,7 +376,7 @@ class DirectedGraph:
 
     def get_transitive_references(
         self,
-        refs: set[Name],
+        refs: Collection[Name],
         inclusive: bool = True,
         predicate: Callable[[Name, VariableData], bool] | None = None,
     ) -> set[Name]:
@@ -391,7 +391,7 @@ class DirectedGraph:
         # TODO: Consider caching on the graph level and updating on register /
         # delete
         processed: set[Name] = set()
-        queue: set[Name] = refs & self.definitions.keys()
+        queue: set[Name] = {ref for ref in refs if ref in self.definitions}
         predicate = predicate or (lambda *_: True)
 
         while queue:
@@ -426,8 +426,8 @@ class DirectedGraph:
                             )
 
         if inclusive:
-            return processed | refs
-        return processed - refs
+            return processed.union(refs)
+        return processed.difference(refs)
 
 
 def transitive_closure(
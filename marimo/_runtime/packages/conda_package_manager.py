@@ -15,7 +15,8 @@ class CondaPackageManager(CanonicalizingPackageManager):
     name = "conda"
     docs_url = "https://docs.conda.io/projects/conda/"
 
-    def _construct_module_name_mapping(self) -> dict[str, str]:
+    @classmethod
+    def _construct_module_name_mapping(cls) -> dict[str, str]:
         return module_name_to_conda_name()
 
 
@@ -24,12 +25,14 @@ class PixiPackageManager(CondaPackageManager):
 
     async def _install(self, package: str, *, upgrade: bool) -> bool:
         if upgrade:
-            return self.run(["pixi", "upgrade", *split_packages(package)])
+            return await self.run(
+                ["pixi", "upgrade", *split_packages(package)]
+            )
         else:
-            return self.run(["pixi", "add", *split_packages(package)])
+            return await self.run(["pixi", "add", *split_packages(package)])
 
     async def uninstall(self, package: str) -> bool:
-        return self.run(["pixi", "remove", *split_packages(package)])
+        return await self.run(["pixi", "remove", *split_packages(package)])
 
     def list_packages(self) -> list[PackageDescription]:
         import json
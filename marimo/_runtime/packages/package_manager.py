@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import subprocess
 from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
 from marimo import _loggers
@@ -12,6 +15,8 @@ from marimo._messaging.ops import Alert
 from marimo._runtime.packages.utils import append_version
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from marimo._server.models.packages import DependencyTreeNode
 
 LOGGER = _loggers.marimo_logger()
@@ -31,6 +36,9 @@ class PackageManager(abc.ABC):
 
     def __init__(self) -> None:
         self._attempted_packages: set[str] = set()
+        # Package managers aren't uninstalled mid-session, so a successful
+        # lookup is remembered; a failed one is retried on the next call
+        self._manager_found = False
 
     @abc.abstractmethod
     def module_to_package(self, module_name: str) -> str:
@@ -44,7 +52,10 @@ class PackageManager(abc.ABC):
 
     def is_manager_installed(self) -> bool:
         """Is the package manager is installed on the user machine?"""
+        if self._manager_found:
+            return True
         if DependencyManager.which(self.name):
+            self._manager_found = True
             return True
         LOGGER.error(
             f"{self.name} is not available. "
@@ -69,6 +80,26 @@ class PackageManager(abc.ABC):
             append_version(package, version), upgrade=upgrade
         )
 
+    async def install_many(
+        self,
+        packages: list[tuple[str, Optional[str]]],
+        *,
+        upgrade: bool = False,
+    ) -> bool:
+        """Attempt to install several packages with one invocation.
+
+        `packages` is a list of (package, version) pairs. Returns True if
+        every package was installed, else False.
+        """
+        self._attempted_packages.update(package for package, _ in packages)
+        return await self._install(
+            " ".join(
+                append_version(package, version)
+                for package, version in packages
+            ),
+            upgrade=upgrade,
+        )
+
     @abc.abstractmethod
     async def uninstall(self, package: str) -> bool:
         """Attempt to uninstall a package
@@ -81,14 +112,34 @@ class PackageManager(abc.ABC):
         """True iff package installation was previously attempted."""
         return package in self._attempted_packages
 
+    def not_yet_attempted(self, packages: Iterable[str]) -> set[str]:
+        """The packages whose installation was not previously attempted."""
+        return set(packages).difference(self._attempted_packages)
+
     def should_auto_install(self) -> bool:
         """Should this package manager auto-install packages"""
         return False
 
-    def run(self, command: list[str]) -> bool:
+    async def run(self, command: list[str]) -> bool:
+        """Run a package manager command without blocking the event loop.
+
+        Returns True if the command exited successfully, else False.
+        """
+        if not self.is_manager_installed():
+            return False
+        try:
+            proc = await asyncio.create_subprocess_exec(*command)
+        except NotImplementedError:
+            # Selector event loops on Windows can't spawn subprocesses
+            completed = await asyncio.to_thread(subprocess.run, command)
+            return completed.returncode == 0
+        return await proc.wait() == 0
+
+    def _run_sync(self, command: list[str]) -> bool:
+        """Blocking variant of `run`, for synchronous callers."""
         if not self.is_manager_installed():
             return False
-        proc = subprocess.run(command)  # noqa: ASYNC101
+        proc = subprocess.run(command)
         return proc.returncode == 0
 
     def update_notebook_script_metadata(
@@ -159,45 +210,34 @@ class CanonicalizingPackageManager(PackageManager):
     Subclasses needs to implement _construct_module_name_mapping.
     """
 
-    def __init__(self) -> None:
-        # Initialized lazily
-        self._module_name_to_repo_name: dict[str, str] | None = None
-        self._repo_name_to_module_name: dict[str, str] | None = None
-        super().__init__()
-
+    @classmethod
     @abc.abstractmethod
-    def _construct_module_name_mapping(self) -> dict[str, str]: ...
-
-    def _initialize_mappings(self) -> None:
-        if self._module_name_to_repo_name is None:
-            self._module_name_to_repo_name = (
-                self._construct_module_name_mapping()
-            )
-
-        if self._repo_name_to_module_name is None:
-            self._repo_name_to_module_name = {
-                v: k for k, v in self._module_name_to_repo_name.items()
-            }
+    def _construct_module_name_mapping(cls) -> dict[str, str]: ...
+
+    @classmethod
+    @cache
+    def _mappings(cls) -> tuple[Mapping[str, str], Mapping[str, str]]:
+        """Read-only module <-> package name maps, built once per class."""
+        module_to_repo = cls._construct_module_name_mapping()
+        repo_to_module = {v: k for k, v in module_to_repo.items()}
+        return (
+            MappingProxyType(module_to_repo),
+            MappingProxyType(repo_to_module),
+        )
 
     def module_to_package(self, module_name: str) -> str:
         """Canonicalizes a module name to a package name on PyPI."""
-        if self._module_name_to_repo_name is None:
-            self._initialize_mappings()
-        assert self._module_name_to_repo_name is not None
-
-        if module_name in self._module_name_to_repo_name:
-            return self._module_name_to_repo_name[module_name]
+        module_to_repo, _ = self._mappings()
+        if module_name in module_to_repo:
+            return module_to_repo[module_name]
         else:
             return module_name.replace("_", "-")
 
     def package_to_module(self, package_name: str) -> str:
         """Canonicalizes a package name to a module name."""
-        if self._repo_name_to_module_name is None:
-            self._initialize_mappings()
-        assert self._repo_name_to_module_name is not None
-
+        _, repo_to_module = self._mappings()
         return (
-            self._repo_name_to_module_name[package_name]
-            if package_name in self._repo_name_to_module_name
+            repo_to_module[package_name]
+            if package_name in repo_to_module
             else package_name.replace("-", "_")
         )
@@ -8,7 +8,7 @@ import sys
 import tempfile
 from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 from marimo import _loggers
 from marimo._runtime.packages.module_name_to_pypi_name import (
@@ -18,7 +18,10 @@ from marimo._runtime.packages.package_manager import (
     CanonicalizingPackageManager,
     PackageDescription,
 )
-from marimo._runtime.packages.utils import split_packages
+from marimo._runtime.packages.utils import (
+    site_packages_key,
+    split_packages,
+)
 from marimo._server.models.packages import DependencyTreeNode
 from marimo._utils.platform import is_pyodide
 from marimo._utils.uv import find_uv_bin
@@ -30,9 +33,35 @@ LOGGER = _loggers.marimo_logger()
 
 
 class PypiPackageManager(CanonicalizingPackageManager):
-    def _construct_module_name_mapping(self) -> dict[str, str]:
+    # Package listings of this interpreter by command, tagged with the
+    # site-packages key they were listed at; shared by all instances, since
+    # a package manager is created per request
+    _interpreter_packages: ClassVar[
+        dict[tuple[str, ...], tuple[tuple[int, ...], list[PackageDescription]]]
+    ] = {}
+
+    @classmethod
+    def _construct_module_name_mapping(cls) -> dict[str, str]:
         return module_name_to_pypi_name()
 
+    def _list_interpreter_packages(
+        self, cmd: list[str]
+    ) -> list[PackageDescription]:
+        """List this interpreter's packages with `cmd`.
+
+        The last listing is reused until site-packages changes, including
+        when packages are installed outside of marimo.
+        """
+        key = site_packages_key()
+        cached = self._interpreter_packages.get(tuple(cmd))
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+        packages = self._list_packages_from_cmd(cmd)
+        # Failed listings are empty; don't hold on to them
+        if packages:
+            self._interpreter_packages[tuple(cmd)] = (key, packages)
+        return list(packages)
+
     def _list_packages_from_cmd(
         self, cmd: list[str]
     ) -> list[PackageDescription]:
@@ -61,11 +90,11 @@ class PipPackageManager(PypiPackageManager):
         if upgrade:
             cmd.append("--upgrade")
         cmd.extend(split_packages(package))
-        return self.run(cmd)
+        return await self.run(cmd)
 
     async def uninstall(self, package: str) -> bool:
         LOGGER.info(f"Uninstalling {package} with pip")
-        return self.run(
+        return await self.run(
             [
                 "pip",
                 "--python",
@@ -78,7 +107,7 @@ class PipPackageManager(PypiPackageManager):
 
     def list_packages(self) -> list[PackageDescription]:
         cmd = ["pip", "--python", PY_EXE, "list", "--format=json"]
-        return self._list_packages_from_cmd(cmd)
+        return self._list_interpreter_packages(cmd)
 
 
 class MicropipPackageManager(PypiPackageManager):
@@ -157,7 +186,7 @@ class UvPackageManager(PypiPackageManager):
         if upgrade:
             install_cmd.append("--upgrade")
 
-        return self.run(
+        return await self.run(
             # trade installation time for faster start time
             install_cmd + ["--compile", *split_packages(package), "-p", PY_EXE]
         )
@@ -305,9 +334,9 @@ class UvPackageManager(PypiPackageManager):
             if upgrade:
                 cmd.append("--upgrade")
             cmd.extend(packages_to_add)
-            self.run(cmd)
+            self._run_sync(cmd)
         if packages_to_remove:
-            self.run(
+            self._run_sync(
                 [self._uv_bin, "--quiet", "remove", "--script", filepath]
                 + packages_to_remove
             )
@@ -367,14 +396,14 @@ class UvPackageManager(PypiPackageManager):
             LOGGER.info(f"Uninstalling {package} with 'uv pip uninstall'")
             uninstall_cmd = [self._uv_bin, "pip", "uninstall"]
 
-        return self.run(
+        return await self.run(
             uninstall_cmd + [*split_packages(package), "-p", PY_EXE]
         )
 
     def list_packages(self) -> list[PackageDescription]:
         LOGGER.info("Listing packages with 'uv pip list'")
         cmd = [self._uv_bin, "pip", "list", "--format=json", "-p", PY_EXE]
-        return self._list_packages_from_cmd(cmd)
+        return self._list_interpreter_packages(cmd)
 
     def dependency_tree(
         self, filename: Optional[str] = None
@@ -416,13 +445,13 @@ class RyePackageManager(PypiPackageManager):
 
     async def _install(self, package: str, *, upgrade: bool) -> bool:
         if upgrade:
-            return self.run(
+            return await self.run(
                 ["rye", "sync", "--update", *split_packages(package)]
             )
-        return self.run(["rye", "add", *split_packages(package)])
+        return await self.run(["rye", "add", *split_packages(package)])
 
     async def uninstall(self, package: str) -> bool:
-        return self.run(["rye", "remove", *split_packages(package)])
+        return await self.run(["rye", "remove", *split_packages(package)])
 
     def list_packages(self) -> list[PackageDescription]:
         cmd = ["rye", "list", "--format=json"]
@@ -435,7 +464,7 @@ class PoetryPackageManager(PypiPackageManager):
 
     async def _install(self, package: str, *, upgrade: bool) -> bool:
         if upgrade:
-            return self.run(
+            return await self.run(
                 [
                     "poetry",
                     "update",
@@ -444,12 +473,12 @@ class PoetryPackageManager(PypiPackageManager):
                 ]
             )
 
-        return self.run(
+        return await self.run(
             ["poetry", "add", "--no-interaction", *split_packages(package)]
         )
 
     async def uninstall(self, package: str) -> bool:
-        return self.run(
+        return await self.run(
             ["poetry", "remove", "--no-interaction", *split_packages(package)]
         )
 
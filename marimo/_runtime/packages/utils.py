@@ -4,7 +4,10 @@ from __future__ import annotations
 import dataclasses
 import os
 import re
+import site
 import sys
+import sysconfig
+from functools import lru_cache
 from typing import Optional
 
 from marimo._utils.platform import is_pyodide
@@ -44,13 +47,28 @@ def is_python_isolated() -> bool:
     )
 
 
+def site_packages_key() -> tuple[int, ...]:
+    """The mtimes of this interpreter's site-packages directories.
+
+    Installing, upgrading or removing a distribution adds or removes its
+    *.dist-info directory, which changes the key.
+    """
+    paths = {sysconfig.get_path("purelib"), sysconfig.get_path("platlib")}
+    if site.ENABLE_USER_SITE:
+        paths.add(site.getusersitepackages())
+    key: list[int] = []
+    for path in sorted(paths):
+        try:
+            key.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            key.append(-1)
+    return tuple(key)
+
+
+@lru_cache(maxsize=1024)
 def append_version(pkg_name: str, version: Optional[str]) -> str:
     """Qualify a version string with a leading '==' if it doesn't have one"""
-    if version is None:
-        return pkg_name
-    if version == "":
-        return pkg_name
-    if version == "latest":
+    if not version or version == "latest":
         return pkg_name
     return f"{pkg_name}=={version}"
 
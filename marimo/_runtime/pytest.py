@@ -18,6 +18,7 @@ MARIMO_TEST_BLOCK_REGEX = re.compile(rf"{MARIMO_TEST_STUB_NAME}_\d+[(?::)\.]+")
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from pathlib import Path
 
     import _pytest.Item  # type: ignore
@@ -110,7 +111,7 @@ class ReplaceStubPlugin:
 
     def __init__(
         self,
-        defs: Optional[set[str]] = None,
+        defs: Optional[Collection[str]] = None,
         lcls: Optional[dict[str, Any]] = None,
     ) -> None:
         if lcls is None:
@@ -231,7 +232,7 @@ class ReplaceStubPlugin:
 
 
 def run_pytest(
-    defs: set[str] | None = None,
+    defs: Collection[str] | None = None,
     lcls: dict[str, Any] | None = None,
     notebook_path: Path | str | None = None,
 ) -> MarimoPytestResult:
@@ -874,7 +874,11 @@ class Kernel:
         return error
 
     def _maybe_register_cell(
-        self, cell_id: CellId_t, code: str, stale: bool
+        self,
+        cell_id: CellId_t,
+        code: str,
+        stale: bool,
+        pending_import_namespaces: set[Name],
     ) -> tuple[set[CellId_t], Optional[Error]]:
         """Register a cell (given by id, code) if not already registered.
 
@@ -882,6 +886,10 @@ class Kernel:
         code, that cell is deleted from the graph and a new cell with the
         same id but different code is registered.
 
+        Namespaces newly imported by the cell are added to
+        `pending_import_namespaces`, for the caller to add to the script
+        metadata once for all the cells it registers.
+
         Returns:
         - a set of ids for cells that were previously children of `cell_id`
           but are no longer children of `cell_id` after registration;
@@ -938,9 +946,8 @@ class Kernel:
                         if previous_cell
                         else set()
                     )
-                    to_add = cell.imported_namespaces - prev_imports
-                    self.packages_callbacks.update_script_metadata(
-                        import_namespaces_to_add=list(to_add)
+                    pending_import_namespaces |= (
+                        cell.imported_namespaces - prev_imports
                     )
 
         LOGGER.debug(
@@ -1127,10 +1134,18 @@ class Kernel:
         # Cells that were unable to be added to the graph due to syntax errors
         syntax_errors: dict[CellId_t, Error] = {}
 
+        # Namespaces newly imported by the registered cells; the script
+        # metadata is updated once for all of them, since each update
+        # rewrites the notebook file
+        pending_import_namespaces: set[Name] = set()
+
         # Register and delete cells
         for er in execution_requests:
             old_children, error = self._maybe_register_cell(
-                er.cell_id, er.code, stale=er.cell_id in cells_starting_stale
+                er.cell_id,
+                er.code,
+                stale=er.cell_id in cells_starting_stale,
+                pending_import_namespaces=pending_import_namespaces,
             )
             cells_that_were_children_of_mutated_cells |= old_children
             if error is None:
@@ -1138,6 +1153,11 @@ class Kernel:
             else:
                 syntax_errors[er.cell_id] = error
 
+        if pending_import_namespaces:
+            self.packages_callbacks.update_script_metadata(
+                import_namespaces_to_add=sorted(pending_import_namespaces)
+            )
+
         for dr in deletion_requests:
             if dr.cell_id not in cells_before_mutation:
                 continue
@@ -1592,8 +1612,8 @@ class Kernel:
             return
         elif not cell:
             return
-        cell.defs.clear()  # remove definitions
-        cell.refs.clear()  # remove references
+        # remove definitions and references
+        cell = dataclasses.replace(cell, defs=frozenset(), refs=frozenset())
 
         # Create graph of just the scratchpad cell
         graph = dataflow.DirectedGraph()
@@ -2431,11 +2451,7 @@ class PackagesCallbacks:
                 # filter out packages that we already attempted to install
                 # to prevent an infinite loop
                 missing_packages.update(
-                    {
-                        pkg
-                        for pkg in e.package_names
-                        if not self.package_manager.attempted_to_install(pkg)
-                    }
+                    self.package_manager.not_yet_attempted(e.package_names)
                 )
                 continue
 
@@ -2449,11 +2465,9 @@ class PackagesCallbacks:
             )
             if maybe_missing_packages:
                 missing_packages.update(
-                    {
-                        pkg
-                        for pkg in maybe_missing_packages
-                        if not self.package_manager.attempted_to_install(pkg)
-                    }
+                    self.package_manager.not_yet_attempted(
+                        maybe_missing_packages
+                    )
                 )
 
         # Grab missing modules from module registry and from module not found errors
@@ -2461,13 +2475,14 @@ class PackagesCallbacks:
             self._kernel.module_registry.missing_modules() | missing_modules
         )
 
-        # Convert modules to packages
-        for mod in missing_modules:
-            pkg = self.package_manager.module_to_package(mod)
-            # filter out packages that we already attempted to install
-            # to prevent an infinite loop
-            if not self.package_manager.attempted_to_install(pkg):
-                missing_packages.add(pkg)
+        # Convert modules to packages, filtering out packages that we
+        # already attempted to install to prevent an infinite loop
+        missing_packages.update(
+            self.package_manager.not_yet_attempted(
+                self.package_manager.module_to_package(mod)
+                for mod in missing_modules
+            )
+        )
 
         if not missing_packages:
             return
@@ -2531,11 +2546,36 @@ class PackagesCallbacks:
         }
         InstallingPackageAlert(packages=package_statuses).broadcast()
 
-        for pkg in missing_packages:
-            if self.package_manager.attempted_to_install(package=pkg):
-                # Already attempted an installation; it must have failed.
-                # Skip the installation.
-                continue
+        # Already attempted installations must have failed; skip them.
+        packages_to_install = [
+            pkg
+            for pkg in missing_packages
+            if not self.package_manager.attempted_to_install(package=pkg)
+        ]
+
+        # Install everything with a single package manager invocation,
+        # paying its startup and resolution cost once.
+        if len(packages_to_install) > 1:
+            for pkg in packages_to_install:
+                package_statuses[pkg] = "installing"
+            InstallingPackageAlert(packages=package_statuses).broadcast()
+            if await self.package_manager.install_many(
+                [
+                    (pkg, request.versions.get(pkg))
+                    for pkg in packages_to_install
+                ]
+            ):
+                for pkg in packages_to_install:
+                    package_statuses[pkg] = "installed"
+                InstallingPackageAlert(packages=package_statuses).broadcast()
+                packages_to_install = []
+            else:
+                for pkg in packages_to_install:
+                    package_statuses[pkg] = "queued"
+
+        # Install one at a time, either because there is a single package
+        # or to find out which packages made the batch fail.
+        for pkg in packages_to_install:
             package_statuses[pkg] = "installing"
             InstallingPackageAlert(packages=package_statuses).broadcast()
             version = request.versions.get(pkg)
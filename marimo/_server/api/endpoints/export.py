@@ -1,11 +1,15 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING
+from urllib.parse import quote
 
 from starlette.authentication import requires
+from starlette.background import BackgroundTask
 from starlette.exceptions import HTTPException
-from starlette.responses import HTMLResponse, PlainTextResponse
+from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse
 
 from marimo import _loggers
 from marimo._server.api.deps import AppState
@@ -18,10 +22,11 @@ from marimo._server.models.export import (
     ExportAsMarkdownRequest,
     ExportAsScriptRequest,
 )
-from marimo._server.models.models import SuccessResponse
 from marimo._server.router import APIRouter
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
     from starlette.requests import Request
 
 LOGGER = _loggers.marimo_logger()
@@ -29,9 +34,51 @@ LOGGER = _loggers.marimo_logger()
 # Router for export endpoints
 router = APIRouter()
 
+# Exporter is stateless, so one instance serves every request
+exporter = Exporter()
 auto_exporter = AutoExporter()
 
 
+@lru_cache(maxsize=512)
+def _download_headers(filename: str) -> Mapping[str, str]:
+    """Headers to download a file as `filename`.
+
+    Like starlette's FileResponse, names that aren't URL-safe are sent
+    percent-encoded as `filename*` (RFC 6266), so that spaces, quotes and
+    non-ASCII characters survive.
+    """
+    quoted = quote(filename)
+    if quoted != filename:
+        disposition = f"attachment; filename*=utf-8''{quoted}"
+    else:
+        disposition = f'attachment; filename="{filename}"'
+    return MappingProxyType({"Content-Disposition": disposition})
+
+
+async def _run_auto_export(
+    export: Callable[[], Awaitable[None]], export_type: str
+) -> None:
+    try:
+        await export()
+    except Exception as e:
+        LOGGER.error(f"Failed to auto-export to {export_type}: {e}")
+
+
+def _accepted(
+    export: Callable[[], Awaitable[None]], export_type: str
+) -> JSONResponse:
+    """Respond immediately and run the export after the response is sent.
+
+    The client discards the body of auto-export responses, so there is no
+    reason to hold the response open for serialization and disk writes.
+    """
+    return JSONResponse(
+        content={"success": True},
+        status_code=HTTPStatus.ACCEPTED,
+        background=BackgroundTask(_run_auto_export, export, export_type),
+    )
+
+
 @router.post("/html")
 @requires("read")
 async def export_as_html(
@@ -69,7 +116,7 @@ async def export_as_html(
     if app_state.mode != SessionMode.EDIT:
         body.include_code = False
 
-    html, filename = Exporter().export_as_html(
+    html, filename = await exporter.export_as_html_async(
         app=session.app_file_manager.app,
         filename=session.app_file_manager.filename,
         session_view=session.session_view,
@@ -77,10 +124,8 @@ async def export_as_html(
         request=body,
     )
 
-    if body.download:
-        headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    else:
-        headers = {}
+    # Only downloads need a Content-Disposition header
+    headers = _download_headers(filename) if body.download else None
 
     # Download the HTML
     return HTMLResponse(
@@ -94,7 +139,7 @@ async def export_as_html(
 async def auto_export_as_html(
     *,
     request: Request,
-) -> SuccessResponse | PlainTextResponse:
+) -> JSONResponse | PlainTextResponse:
     """
     requestBody:
         content:
@@ -102,7 +147,7 @@ async def auto_export_as_html(
                 schema:
                     $ref: "#/components/schemas/ExportAsHTMLRequest"
     responses:
-        200:
+        202:
             description: Export the notebook as HTML
             content:
                 application/json:
@@ -135,22 +180,24 @@ async def auto_export_as_html(
         LOGGER.info("No outputs to export")
         return PlainTextResponse(status_code=HTTPStatus.NOT_MODIFIED)
 
-    html, _filename = Exporter().export_as_html(
-        app=session.app_file_manager.app,
-        filename=session.app_file_manager.filename,
-        session_view=session_view,
-        display_config=session.config_manager.get_config()["display"],
-        request=body,
-    )
+    async def export() -> None:
+        html, _filename = await exporter.export_as_html_async(
+            app=session.app_file_manager.app,
+            filename=session.app_file_manager.filename,
+            session_view=session_view,
+            display_config=session.config_manager.get_config()["display"],
+            request=body,
+        )
 
-    # Save the HTML file to disk, at `.marimo/<filename>.html`
-    await auto_exporter.save_html(
-        filename=session.app_file_manager.filename,
-        html=html,
-    )
-    session_view.mark_auto_export_html()
+        # Save the HTML file to disk, at `.marimo/<filename>.html`
+        await auto_exporter.save_html(
+            filename=session.app_file_manager.filename,
+            html=html,
+        )
+        # Only mark as exported once saved, so a failed export is retried
+        session_view.mark_auto_export_html()
 
-    return SuccessResponse()
+    return _accepted(export, "HTML")
 
 
 @router.post("/script")
@@ -179,15 +226,13 @@ async def export_as_script(
     body = await parse_request(request, cls=ExportAsScriptRequest)
     session = app_state.require_current_session()
 
-    python, filename = Exporter().export_as_script(
+    python, filename = exporter.export_as_script(
         app=session.app_file_manager.app,
         filename=session.app_file_manager.filename,
     )
 
-    if body.download:
-        headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    else:
-        headers = {}
+    # Only downloads need a Content-Disposition header
+    headers = _download_headers(filename) if body.download else None
 
     # Download the Script
     return PlainTextResponse(
@@ -230,15 +275,13 @@ async def export_as_markdown(
             detail="File must be saved before downloading",
         )
 
-    markdown, filename = Exporter().export_as_md(
+    markdown, filename = exporter.export_as_md(
         notebook=app_file_manager.app.to_ir(),
         filename=app_file_manager.filename,
     )
 
-    if body.download:
-        headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    else:
-        headers = {}
+    # Only downloads need a Content-Disposition header
+    headers = _download_headers(filename) if body.download else None
 
     # Download the Markdown
     return PlainTextResponse(
@@ -252,7 +295,7 @@ async def export_as_markdown(
 async def auto_export_as_markdown(
     *,
     request: Request,
-) -> SuccessResponse | PlainTextResponse:
+) -> JSONResponse | PlainTextResponse:
     """
     requestBody:
         content:
@@ -260,7 +303,7 @@ async def auto_export_as_markdown(
                 schema:
                     $ref: "#/components/schemas/ExportAsMarkdownRequest"
     responses:
-        200:
+        202:
             description: Export the notebook as a markdown
             content:
                 application/json:
@@ -287,19 +330,20 @@ async def auto_export_as_markdown(
     # Reload the file manager to get the latest state
     session.app_file_manager.reload()
 
-    markdown, _filename = Exporter().export_as_md(
-        notebook=session.app_file_manager.app.to_ir(),
-        filename=session.app_file_manager.filename,
-    )
+    async def export() -> None:
+        markdown, _filename = exporter.export_as_md(
+            notebook=session.app_file_manager.app.to_ir(),
+            filename=session.app_file_manager.filename,
+        )
 
-    # Save the Markdown file to disk, at `.marimo/<filename>.md`
-    await auto_exporter.save_md(
-        filename=session.app_file_manager.filename,
-        markdown=markdown,
-    )
-    session_view.mark_auto_export_md()
+        # Save the Markdown file to disk, at `.marimo/<filename>.md`
+        await auto_exporter.save_md(
+            filename=session.app_file_manager.filename,
+            markdown=markdown,
+        )
+        session_view.mark_auto_export_md()
 
-    return SuccessResponse()
+    return _accepted(export, "Markdown")
 
 
 @router.post("/auto_export/ipynb")
@@ -307,7 +351,7 @@ async def auto_export_as_markdown(
 async def auto_export_as_ipynb(
     *,
     request: Request,
-) -> SuccessResponse | PlainTextResponse:
+) -> JSONResponse | PlainTextResponse:
     """
     requestBody:
         content:
@@ -315,7 +359,7 @@ async def auto_export_as_ipynb(
                 schema:
                     $ref: "#/components/schemas/ExportAsIPYNBRequest"
     responses:
-        200:
+        202:
             description: Export the notebook as IPYNB
             content:
                 application/json:
@@ -342,18 +386,19 @@ async def auto_export_as_ipynb(
     # Reload the file manager to get the latest state
     session.app_file_manager.reload()
 
-    ipynb, _filename = Exporter().export_as_ipynb(
-        app=session.app_file_manager.app,
-        filename=session.app_file_manager.filename,
-        sort_mode="top-down",
-        session_view=session_view,
-    )
+    async def export() -> None:
+        ipynb, _filename = exporter.export_as_ipynb(
+            app=session.app_file_manager.app,
+            filename=session.app_file_manager.filename,
+            sort_mode="top-down",
+            session_view=session_view,
+        )
 
-    # Save the IPYNB file to disk, at `.marimo/<filename>.ipynb`
-    await auto_exporter.save_ipynb(
-        filename=session.app_file_manager.filename,
-        ipynb=ipynb,
-    )
-    session_view.mark_auto_export_ipynb()
+        # Save the IPYNB file to disk, at `.marimo/<filename>.ipynb`
+        await auto_exporter.save_ipynb(
+            filename=session.app_file_manager.filename,
+            ipynb=ipynb,
+        )
+        session_view.mark_auto_export_ipynb()
 
-    return SuccessResponse()
+    return _accepted(export, "IPYNB")
@@ -3,8 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import socket
-from typing import TYPE_CHECKING
+import ipaddress
+from typing import TYPE_CHECKING, Optional
 
 from marimo import _loggers
 from marimo._server.api.deps import AppState, AppStateBase
@@ -32,29 +32,20 @@ LOGGER = _loggers.marimo_logger()
 
 
 @contextlib.asynccontextmanager
-async def lsp(app: Starlette) -> AsyncIterator[None]:
+async def core(app: Starlette) -> AsyncIterator[None]:
     state = AppState.from_app(app)
-    user_config = state.config_manager.get_config()
     session_mgr = state.session_manager
 
-    # Only start the LSP server in Edit mode
+    # Mimetypes
+    initialize_mimetypes()
+
+    # Only start the LSP server (and MCP servers) in Edit mode
     if session_mgr.mode == SessionMode.EDIT:
+        user_config = state.config_manager.get_config()
         if any_lsp_server_running(user_config):
             LOGGER.debug("Language Servers are enabled")
             await session_mgr.start_lsp_server()
-
-    yield
-
-
-@contextlib.asynccontextmanager
-async def mcp(app: Starlette) -> AsyncIterator[None]:
-    state = AppState.from_app(app)
-    session_mgr = state.session_manager
-
-    # Only start MCP servers in Edit mode
-    if session_mgr.mode == SessionMode.EDIT:
         # add MCP server here after it is implemented
-        ...
 
     yield
 
@@ -62,16 +53,22 @@ async def mcp(app: Starlette) -> AsyncIterator[None]:
 @contextlib.asynccontextmanager
 async def open_browser(app: Starlette) -> AsyncIterator[None]:
     state = AppState.from_app(app)
+    task: asyncio.Task[None] | None = None
     if not state.headless:
         url = _startup_url(state)
         user_config = state.config_manager.get_config()
         browser = user_config["server"]["browser"]
-        # Wait 20ms for the server to start and then open the browser, but this
-        # function must complete
-        asyncio.get_running_loop().call_later(
-            0.02, open_url_in_browser, browser, url
-        )
+
+        async def _open() -> None:
+            # Yield once so startup can finish binding the socket; launching
+            # the browser runs in a thread so it doesn't block the event loop
+            await asyncio.sleep(0)
+            await asyncio.to_thread(open_url_in_browser, browser, url)
+
+        task = asyncio.create_task(_open())
     yield
+    if task is not None and not task.done():
+        task.cancel()
 
 
 @contextlib.asynccontextmanager
@@ -118,29 +115,28 @@ async def signal_handler(app: Starlette) -> AsyncIterator[None]:
     yield
 
 
-@contextlib.asynccontextmanager
-async def etc(app: Starlette) -> AsyncIterator[None]:
-    del app
-    # Mimetypes
-    initialize_mimetypes()
-    yield
+def _startup_url(state: AppStateBase) -> str:
+    # Computed once per app; the logging and open_browser lifespans both
+    # need it, and none of its inputs change while the server is running
+    startup_url: Optional[str] = getattr(state.state, "startup_url", None)
+    if startup_url is None:
+        startup_url = _format_startup_url(state)
+        state.state.startup_url = startup_url
+    return startup_url
 
 
-def _startup_url(state: AppStateBase) -> str:
+def _format_startup_url(state: AppStateBase) -> str:
     host = state.host
     port = state.port
+    # pretty printing:
+    # if the address is a loopback address, print "localhost" to stdout.
+    # This avoids a reverse DNS lookup, which can hang on misconfigured
+    # networks.
     try:
-        # pretty printing:
-        # if the address maps to localhost, print "localhost" to stdout
-        if (
-            socket.getnameinfo((host, port), socket.NI_NOFQDN)[0]
-            == "localhost"
-        ):
+        if ipaddress.ip_address(host).is_loopback:
             host = "localhost"
-    except Exception:
-        # aggressive try/except in case of platform-specific quirks;
-        # nothing to handle, since the `try` logic is just for pretty
-        # printing the host name
+    except ValueError:
+        # not an IP address, e.g. a hostname
         ...
 
     url = f"http://{host}:{port}{state.base_url}"
@@ -7,6 +7,7 @@ from typing import Optional
 
 class HTTPStatus(IntEnum):
     OK = 200
+    ACCEPTED = 202
     NOT_MODIFIED = 304
     BAD_REQUEST = 400
     FORBIDDEN = 403
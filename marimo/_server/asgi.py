@@ -473,7 +473,7 @@ def create_asgi_app(
                 lifespan=Lifespans(
                     [
                         # Not all lifespans are needed for run mode
-                        lifespans.etc,
+                        lifespans.core,
                         lifespans.signal_handler,
                         *LIFESPAN_REGISTRY.get_all(),
                     ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import io
 import mimetypes
 from concurrent.futures import ThreadPoolExecutor
@@ -76,31 +77,57 @@ class Exporter:
         display_config: DisplayConfig,
         request: ExportAsHTMLRequest,
     ) -> tuple[str, str]:
-        index_html = get_html_contents()
+        return self._render_html(
+            index_html=get_html_contents(),
+            virtual_files=_read_virtual_files(request.files),
+            filename=filename,
+            app=app,
+            session_view=session_view,
+            display_config=display_config,
+            request=request,
+        )
 
-        filename = get_filename(filename)
+    async def export_as_html_async(
+        self,
+        *,
+        filename: Optional[str],
+        app: InternalApp,
+        session_view: SessionView,
+        display_config: DisplayConfig,
+        request: ExportAsHTMLRequest,
+    ) -> tuple[str, str]:
+        """Export as HTML without blocking the event loop on file reads.
+
+        The HTML template and virtual files are read concurrently in worker
+        threads. Serialization stays on the calling thread, since the
+        session view is mutated from the event loop.
+        """
+        index_html, virtual_files = await asyncio.gather(
+            asyncio.to_thread(get_html_contents),
+            asyncio.to_thread(_read_virtual_files, request.files),
+        )
+        return self._render_html(
+            index_html=index_html,
+            virtual_files=virtual_files,
+            filename=filename,
+            app=app,
+            session_view=session_view,
+            display_config=display_config,
+            request=request,
+        )
 
-        virtual_files: dict[str, str] = {}
-        for filename_and_length in request.files:
-            if "@file/" in filename_and_length:
-                virtual_file = filename_and_length[7:]
-                try:
-                    byte_length, basename = virtual_file.split("-", 1)
-                    buffer_contents = read_virtual_file(
-                        basename, int(byte_length)
-                    )
-                except Exception as e:
-                    LOGGER.warning(
-                        "File not found in export: %s. Error: %s",
-                        filename_and_length,
-                        e,
-                    )
-                    continue
-                mime_type = mimetypes.guess_type(basename)[0] or "text/plain"
-                virtual_files[filename_and_length] = build_data_url(
-                    cast(KnownMimeType, mime_type),
-                    base64.b64encode(buffer_contents),
-                )
+    def _render_html(
+        self,
+        *,
+        index_html: str,
+        virtual_files: dict[str, str],
+        filename: Optional[str],
+        app: InternalApp,
+        session_view: SessionView,
+        display_config: DisplayConfig,
+        request: ExportAsHTMLRequest,
+    ) -> tuple[str, str]:
+        filename = get_filename(filename)
 
         # We only want pass the display config in the static notebook,
         # since we use:
@@ -480,6 +507,9 @@ class AutoExporter:
     def __init__(self) -> None:
         # Cache directories we've already created to avoid redundant checks
         self._created_dirs: set[Path] = set()
+        # Digest of the content last written to each path, so that
+        # unchanged exports don't hit the disk again
+        self._saved_digests: dict[Path, bytes] = {}
         # Thread pool for blocking I/O operations
         self._executor = ThreadPoolExecutor(
             max_workers=4, thread_name_prefix="export"
@@ -495,7 +525,7 @@ class AutoExporter:
         filepath = directory / self.EXPORT_DIR / filename
 
         # Run blocking file I/O in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(
             self._executor, self._write_file_sync, filepath, content
         )
@@ -513,7 +543,13 @@ class AutoExporter:
         """Synchronous file write (runs in thread pool)"""
         if content == "":
             return
+        digest = hashlib.blake2b(
+            content.encode("utf-8"), digest_size=16
+        ).digest()
+        if self._saved_digests.get(filepath) == digest and filepath.exists():
+            return
         filepath.write_text(content, encoding="utf-8")
+        self._saved_digests[filepath] = digest
 
     async def _ensure_export_dir_async(self, directory: Path) -> None:
         """Async directory creation with caching to avoid redundant checks"""
@@ -523,14 +559,22 @@ class AutoExporter:
         if export_dir in self._created_dirs:
             return
 
-        if not directory.exists():
-            raise FileNotFoundError(f"Directory {directory} does not exist")
-
-        export_dir.mkdir(parents=True, exist_ok=True)
+        # The existence check and mkdir can stall on slow filesystems
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor, self._make_export_dir_sync, directory
+        )
 
         # Cache that we've created this directory
         self._created_dirs.add(export_dir)
 
+    def _make_export_dir_sync(self, directory: Path) -> None:
+        """Synchronous directory creation (runs in thread pool)"""
+        if not directory.exists():
+            raise FileNotFoundError(f"Directory {directory} does not exist")
+
+        (directory / self.EXPORT_DIR).mkdir(parents=True, exist_ok=True)
+
     def cleanup(self) -> None:
         """Cleanup resources"""
         self._executor.shutdown(wait=False)
@@ -559,6 +603,30 @@ def _create_notebook_cell(
     return node
 
 
+def _read_virtual_files(files: list[str]) -> dict[str, str]:
+    """Read virtual files referenced by an export, as data URLs."""
+    virtual_files: dict[str, str] = {}
+    for filename_and_length in files:
+        if "@file/" in filename_and_length:
+            virtual_file = filename_and_length[7:]
+            try:
+                byte_length, basename = virtual_file.split("-", 1)
+                buffer_contents = read_virtual_file(basename, int(byte_length))
+            except Exception as e:
+                LOGGER.warning(
+                    "File not found in export: %s. Error: %s",
+                    filename_and_length,
+                    e,
+                )
+                continue
+            mime_type = mimetypes.guess_type(basename)[0] or "text/plain"
+            virtual_files[filename_and_length] = build_data_url(
+                cast(KnownMimeType, mime_type),
+                base64.b64encode(buffer_contents),
+            )
+    return virtual_files
+
+
 def get_html_contents() -> str:
     if GLOBAL_SETTINGS.DEVELOPMENT_MODE:
         import marimo._utils.requests as requests
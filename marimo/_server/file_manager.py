@@ -46,6 +46,9 @@ class AppFileManager:
             default_auto_download
         )
         self._default_sql_output: SqlOutputType | None = default_sql_output
+        # (path, mtime_ns, size) of the file when the app was last loaded,
+        # or None if the in-memory app may differ from the file
+        self._loaded_stat: Optional[tuple[str, int, int]] = self._stat()
         self.app = self._load_app(self.path)
 
     @staticmethod
@@ -60,8 +63,16 @@ class AppFileManager:
 
         Return any new cell IDs that were added or code that was changed.
         """
+        stat = self._stat()
+        if stat is not None and stat == self._loaded_stat:
+            # The file is unchanged since it was last loaded
+            return set()
+
         prev_cell_manager = self.app.cell_manager
         self.app = self._load_app(self.path)
+        # Only remember the stat once the load succeeds, so that a file
+        # that failed to load is tried again
+        self._loaded_stat = stat
         self.app.cell_manager.sort_cell_ids_by_similarity(prev_cell_manager)
 
         # Return the changes cell IDs
@@ -76,6 +87,16 @@ class AppFileManager:
                 changed_cell_ids.add(cell_id)
         return changed_cell_ids
 
+    def _stat(self) -> Optional[tuple[str, int, int]]:
+        path = self.path
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
     def _is_same_path(self, filename: str) -> bool:
         if self.filename is None:
             return False
@@ -286,6 +307,7 @@ class AppFileManager:
         # Update the file with the latest app config
         # TODO(akshayka): Only change the `app = marimo.App` line (at top level
         # of file), instead of overwriting the whole file.
+        self._loaded_stat = None
         self.app.update_config(config)
         if self.filename is not None:
             return self._save_file(
@@ -306,6 +328,7 @@ class AppFileManager:
             request.layout,
         )
         filename = canonicalize_filename(filename)
+        self._loaded_stat = None
         self.app.with_data(
             cell_ids=cell_ids,
             codes=codes,
@@ -167,9 +167,7 @@ def start(
         host=external_host,
         lifespan=Lifespans(
             [
-                lifespans.lsp,
-                lifespans.mcp,
-                lifespans.etc,
+                lifespans.core,
                 lifespans.signal_handler,
                 lifespans.logging,
                 lifespans.open_browser,
@@ -415,7 +415,7 @@ export interface paths {
       };
       responses: {
         /** @description Export the notebook as HTML */
-        200: {
+        202: {
           headers: {
             [name: string]: unknown;
           };
@@ -461,7 +461,7 @@ export interface paths {
       };
       responses: {
         /** @description Export the notebook as IPYNB */
-        200: {
+        202: {
           headers: {
             [name: string]: unknown;
           };
@@ -507,7 +507,7 @@ export interface paths {
       };
       responses: {
         /** @description Export the notebook as a markdown */
-        200: {
+        202: {
           headers: {
             [name: string]: unknown;
           };
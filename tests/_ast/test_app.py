@@ -768,6 +768,26 @@ class TestApp:
         assert "cell_one" in python_code
         assert "cell_two" in python_code
 
+    def test_allowed_refs_memoized(self) -> None:
+        app = App()
+
+        @app.function
+        def add(a, b):
+            return a + b
+
+        internal_app = InternalApp(app)
+        allowed_refs = internal_app.allowed_refs()
+        assert "add" in allowed_refs
+        # Memoized across InternalApp wrappers of the same app
+        assert InternalApp(app).allowed_refs() is allowed_refs
+
+        @app.function
+        def sub(a, b):
+            return a - b
+
+        # Invalidated when cells change
+        assert "sub" in internal_app.allowed_refs()
+
 
 class TestInvalidSetup:
     @staticmethod
@@ -11,6 +11,7 @@ import pytest
 from marimo import _loggers
 from marimo._ast.app import App
 from marimo._ast.cell import CellConfig
+from marimo._ast.compiler import compile_cell
 
 
 class TestCellRun:
@@ -485,9 +486,40 @@ def test_cell_config_asdict_without_defaults():
     assert config.asdict_without_defaults() == {}
 
 
+def test_cell_config_from_dict():
+    assert CellConfig.from_dict({}) == CellConfig()
+    assert CellConfig.from_dict({"disabled": True}) == CellConfig(
+        disabled=True
+    )
+    # Invalid keys are dropped
+    assert CellConfig.from_dict(
+        {"hide_code": True, "invalid": 1}, warn=False
+    ) == CellConfig(hide_code=True)
+
+
+def test_cell_config_configure():
+    config = CellConfig()
+    config.configure({"hide_code": True})
+    assert config == CellConfig(hide_code=True)
+
+    # Invalid keys are ignored
+    config.configure({"disabled": True, "invalid": 1})
+    assert config == CellConfig(disabled=True, hide_code=True)
+
+    # A full config replaces every field
+    config.configure(CellConfig(column=2))
+    assert config == CellConfig(column=2)
+
+
 def test_is_different_from_default():
     config = CellConfig(hide_code=True)
     assert config.is_different_from_default()
 
     config = CellConfig(hide_code=False)
     assert not config.is_different_from_default()
+
+
+def test_sqls_preserve_private_names() -> None:
+    cell = compile_cell('_df = 1\nmo.sql(f"select * from {_df}")', cell_id="0")
+    assert cell.sqls == ["select * from null"]
+    assert cell.raw_sqls == ["select * from {_df}"]
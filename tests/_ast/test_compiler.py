@@ -70,6 +70,14 @@ class TestParseCell:
         assert cell.refs == set()
         assert not cell.imported_namespaces
 
+    @staticmethod
+    def test_namespace_to_variable() -> None:
+        code = "import matplotlib.pyplot as plt\nimport numpy as np"
+        cell = compile_cell(code)
+        assert cell.namespace_to_variable("matplotlib") == "plt"
+        assert cell.namespace_to_variable("numpy") == "np"
+        assert cell.namespace_to_variable("pandas") is None
+
 
 class TestCompilerFlags:
     @staticmethod
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import textwrap
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
@@ -240,6 +241,35 @@ def test_script_config_manager_with_metadata(tmp_path: Path) -> None:
     }
 
 
+def test_script_config_manager_rereads_on_change(tmp_path: Path) -> None:
+    notebook_path = tmp_path / "notebook.py"
+    header = (
+        "# /// script\n"
+        "# [tool.marimo]\n"
+        "# formatting = {line_length = %d}\n"
+        "# ///\n"
+    )
+    notebook_path.write_text(header % 79)
+
+    manager = ScriptConfigManager(str(notebook_path))
+    with patch.object(
+        manager,
+        "_read_script_config",
+        wraps=manager._read_script_config,
+    ) as read:
+        assert manager.get_config() == {"formatting": {"line_length": 79}}
+        # Unchanged file: the cached config is reused, and not shared
+        config = manager.get_config()
+        config["formatting"]["line_length"] = 1
+        assert manager.get_config() == {"formatting": {"line_length": 79}}
+        assert read.call_count == 1
+
+        notebook_path.write_text(header % 100)
+        os.utime(notebook_path, ns=(0, 0))
+        assert manager.get_config() == {"formatting": {"line_length": 100}}
+        assert read.call_count == 2
+
+
 def test_script_config_manager_invalid_toml(tmp_path: Path) -> None:
     notebook_path = tmp_path / "notebook.py"
     notebook_content = """
@@ -106,6 +106,53 @@ def test_read_pyproject_config_invalid_marimo_section(tmp_path: Path):
     assert result is None
 
 
+def test_read_pyproject_marimo_config_cached(tmp_path: Path):
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text(
+        "[tool.marimo]\nformatting = {line_length = 79}\n"
+    )
+
+    with patch(
+        "marimo._config.reader.read_toml", wraps=read_toml
+    ) as mock_read:
+        result = read_pyproject_marimo_config(pyproject_path)
+        assert result == {"formatting": {"line_length": 79}}
+        result["formatting"]["line_length"] = 1
+        assert read_pyproject_marimo_config(pyproject_path) == {
+            "formatting": {"line_length": 79}
+        }
+        assert mock_read.call_count == 1
+
+        pyproject_path.write_text(
+            "[tool.marimo]\nformatting = {line_length = 100}\n"
+        )
+        os.utime(pyproject_path, ns=(0, 0))
+        assert read_pyproject_marimo_config(pyproject_path) == {
+            "formatting": {"line_length": 100}
+        }
+        assert mock_read.call_count == 2
+
+
+def test_read_pyproject_marimo_config_cached_relative_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # Same size and mtime, so only the resolved path tells them apart
+    for line_length in (79, 80):
+        project = tmp_path / str(line_length)
+        project.mkdir()
+        pyproject_path = project / "pyproject.toml"
+        pyproject_path.write_text(
+            f"[tool.marimo]\nformatting = {{line_length = {line_length}}}\n"
+        )
+        os.utime(pyproject_path, ns=(0, 0))
+
+    for line_length in (79, 80):
+        monkeypatch.chdir(tmp_path / str(line_length))
+        assert read_pyproject_marimo_config("pyproject.toml") == {
+            "formatting": {"line_length": line_length}
+        }
+
+
 def test_read_pyproject_config_no_file(tmp_path: Path):
     nearest_pyproject_toml = find_nearest_pyproject_toml(tmp_path)
     assert nearest_pyproject_toml is None
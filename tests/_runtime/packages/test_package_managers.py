@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from marimo._runtime.packages.package_managers import create_package_manager
@@ -29,7 +31,7 @@ def test_update_script_metadata() -> None:
     runs_calls: list[list[str]] = []
 
     class MockUvPackageManager(UvPackageManager):
-        def run(self, command: list[str]) -> bool:
+        def _run_sync(self, command: list[str]) -> bool:
             runs_calls.append(command)
             return True
 
@@ -55,7 +57,7 @@ def test_update_script_metadata_with_version_map() -> None:
     runs_calls: list[list[str]] = []
 
     class MockUvPackageManager(UvPackageManager):
-        def run(self, command: list[str]) -> bool:
+        def _run_sync(self, command: list[str]) -> bool:
             runs_calls.append(command)
             return True
 
@@ -83,7 +85,7 @@ def test_update_script_metadata_with_mapping() -> None:
     runs_calls: list[list[str]] = []
 
     class MockUvPackageManager(UvPackageManager):
-        def run(self, command: list[str]) -> bool:
+        def _run_sync(self, command: list[str]) -> bool:
             runs_calls.append(command)
             return True
 
@@ -131,7 +133,7 @@ def test_update_script_metadata_marimo_packages() -> None:
     runs_calls: list[list[str]] = []
 
     class MockUvPackageManager(UvPackageManager):
-        def run(self, command: list[str]) -> bool:
+        def _run_sync(self, command: list[str]) -> bool:
             runs_calls.append(command)
             return True
 
@@ -262,7 +264,7 @@ async def test_uv_pip_install() -> None:
     runs_calls: list[list[str]] = []
 
     class MockUvPackageManager(UvPackageManager):
-        def run(self, command: list[str]) -> bool:
+        async def run(self, command: list[str]) -> bool:
             runs_calls.append(command)
             return True
 
@@ -271,3 +273,31 @@ async def test_uv_pip_install() -> None:
     assert runs_calls == [
         ["uv", "pip", "install", "--compile", "foo", "-p", PY_EXE],
     ]
+
+
+def test_is_manager_installed_caches_success() -> None:
+    pm = PipPackageManager()
+    with patch("shutil.which", return_value=None) as which:
+        assert not pm.is_manager_installed()
+        assert not pm.is_manager_installed()
+        # Failed lookups are retried
+        assert which.call_count == 2
+
+    with patch("shutil.which", return_value="/usr/bin/pip") as which:
+        assert pm.is_manager_installed()
+        assert pm.is_manager_installed()
+        which.assert_called_once()
+
+
+async def test_not_yet_attempted() -> None:
+    class MockPipPackageManager(PipPackageManager):
+        async def run(self, command: list[str]) -> bool:
+            del command
+            return True
+
+    pm = MockPipPackageManager()
+    assert pm.not_yet_attempted(["foo", "bar"]) == {"foo", "bar"}
+
+    await pm.install("foo", version=None)
+    assert pm.not_yet_attempted(["foo", "bar"]) == {"bar"}
+    assert pm.not_yet_attempted(iter(["foo"])) == set()
@@ -24,6 +24,8 @@ def test_append_version() -> None:
     assert append_version("foo", None) == "foo"
     assert append_version("foo", "") == "foo"
     assert append_version("foo", "latest") == "foo"
+    # Repeated (package, version) pairs reuse the formatted string
+    assert append_version("foo", "1.2.3") is append_version("foo", "1.2.3")
 
 
 def test_split_packages() -> None:
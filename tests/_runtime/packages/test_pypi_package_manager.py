@@ -3,12 +3,15 @@ from __future__ import annotations
 import json
 import sys
 from functools import partial
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from marimo._ast import compiler
 from marimo._runtime.packages.pypi_package_manager import (
     PackageDescription,
     PipPackageManager,
+    PypiPackageManager,
     UvPackageManager,
 )
 
@@ -17,6 +20,14 @@ parse_cell = partial(compiler.compile_cell, cell_id="0")
 PY_EXE = sys.executable
 
 
+@pytest.fixture(autouse=True)
+def _clear_package_listings():
+    """Don't let package listings leak between tests"""
+    PypiPackageManager._interpreter_packages.clear()
+    yield
+    PypiPackageManager._interpreter_packages.clear()
+
+
 def test_module_to_package() -> None:
     mgr = PipPackageManager()
     assert mgr.module_to_package("marimo") == "marimo"
@@ -31,6 +42,10 @@ def test_package_to_module() -> None:
     assert mgr.package_to_module("scikit-learn") == "sklearn"
 
 
+def test_mappings_shared_across_instances() -> None:
+    assert PipPackageManager()._mappings() is PipPackageManager()._mappings()
+
+
 async def test_failed_install_returns_false() -> None:
     mgr = PipPackageManager()
     # almost surely does not exist
@@ -40,43 +55,45 @@ async def test_failed_install_returns_false() -> None:
 manager = PipPackageManager()
 
 
-@patch("subprocess.run")
+def _mock_proc(returncode: int) -> MagicMock:
+    return MagicMock(wait=AsyncMock(return_value=returncode))
+
+
+@patch("asyncio.create_subprocess_exec")
 async def test_install(mock_run: MagicMock):
-    mock_run.return_value = MagicMock(returncode=0)
+    mock_run.return_value = _mock_proc(0)
 
     result = await manager._install("package1 package2", upgrade=False)
 
     mock_run.assert_called_once_with(
-        ["pip", "--python", PY_EXE, "install", "package1", "package2"],
+        "pip", "--python", PY_EXE, "install", "package1", "package2"
     )
     assert result is True
 
 
-@patch("subprocess.run")
+@patch("asyncio.create_subprocess_exec")
 async def test_install_failure(mock_run: MagicMock):
-    mock_run.return_value = MagicMock(returncode=1)
+    mock_run.return_value = _mock_proc(1)
 
     result = await manager._install("nonexistent-package", upgrade=False)
 
     assert result is False
 
 
-@patch("subprocess.run")
+@patch("asyncio.create_subprocess_exec")
 async def test_uninstall(mock_run: MagicMock):
-    mock_run.return_value = MagicMock(returncode=0)
+    mock_run.return_value = _mock_proc(0)
 
     result = await manager.uninstall("package1 package2")
 
     mock_run.assert_called_once_with(
-        [
-            "pip",
-            "--python",
-            PY_EXE,
-            "uninstall",
-            "-y",
-            "package1",
-            "package2",
-        ],
+        "pip",
+        "--python",
+        PY_EXE,
+        "uninstall",
+        "-y",
+        "package1",
+        "package2",
     )
     assert result is True
 
@@ -103,6 +120,24 @@ def test_list_packages(mock_run: MagicMock):
     assert packages[1] == PackageDescription(name="package2", version="2.1.0")
 
 
+@patch("subprocess.run")
+def test_list_packages_reused_until_site_packages_changes(
+    mock_run: MagicMock,
+):
+    mock_output = json.dumps([{"name": "package1", "version": "1.0.0"}])
+    mock_run.return_value = MagicMock(returncode=0, stdout=mock_output)
+
+    key = "marimo._runtime.packages.pypi_package_manager.site_packages_key"
+    with patch(key, return_value=(1,)):
+        assert manager.list_packages() == PipPackageManager().list_packages()
+        assert mock_run.call_count == 1
+
+    with patch(key, return_value=(2,)):
+        packages = manager.list_packages()
+        assert mock_run.call_count == 2
+    assert packages == [PackageDescription(name="package1", version="1.0.0")]
+
+
 @patch("subprocess.run")
 def test_list_packages_failure(mock_run: MagicMock):
     mock_run.return_value = MagicMock(returncode=1)
@@ -192,71 +227,69 @@ def test_uv_is_in_uv_project_cached(mock_exists: MagicMock):
     assert mock_exists.call_count == 2
 
 
-@patch("subprocess.run")
+@patch("asyncio.create_subprocess_exec")
 @patch.object(UvPackageManager, "is_in_uv_project", False)
 async def test_uv_install_not_in_project(mock_run: MagicMock):
     """Test UV install uses pip subcommand when not in UV project"""
-    mock_run.return_value = MagicMock(returncode=0)
+    mock_run.return_value = _mock_proc(0)
     mgr = UvPackageManager()
 
     result = await mgr._install("package1 package2", upgrade=False)
 
     mock_run.assert_called_once_with(
-        [
-            "uv",
-            "pip",
-            "install",
-            "--compile",
-            "package1",
-            "package2",
-            "-p",
-            PY_EXE,
-        ],
+        "uv",
+        "pip",
+        "install",
+        "--compile",
+        "package1",
+        "package2",
+        "-p",
+        PY_EXE,
     )
     assert result is True
 
 
-@patch("subprocess.run")
+@patch("asyncio.create_subprocess_exec")
 @patch.object(UvPackageManager, "is_in_uv_project", True)
 async def test_uv_install_in_project(mock_run: MagicMock):
     """Test UV install uses add subcommand when in UV project"""
-    mock_run.return_value = MagicMock(returncode=0)
+    mock_run.return_value = _mock_proc(0)
     mgr = UvPackageManager()
 
     result = await mgr._install("package1 package2", upgrade=False)
 
     mock_run.assert_called_once_with(
-        ["uv", "add", "--compile", "package1", "package2", "-p", PY_EXE],
+        "uv", "add", "--compile", "package1", "package2", "-p", PY_EXE
     )
     assert result is True
 
 
-@patch("subprocess.run")
+@patch("asyncio.create_subprocess_exec")
 @patch.object(UvPackageManager, "is_in_uv_project", False)
 async def test_uv_uninstall_not_in_project(mock_run: MagicMock):
     """Test UV uninstall uses pip subcommand when not in UV project"""
-    mock_run.return_value = MagicMock(returncode=0)
+    mock_run.return_value = _mock_proc(0)
     mgr = UvPackageManager()
 
     result = await mgr.uninstall("package1 package2")
 
     mock_run.assert_called_once_with(
-        ["uv", "pip", "uninstall", "package1", "package2", "-p", PY_EXE],
+        "uv", "pip", "uninstall", "package1", "package2", "-p", PY_EXE
     )
     assert result is True
 
 
-@patch("subprocess.run")
+@patch("asyncio.create_subprocess_exec")
 @patch.object(UvPackageManager, "is_in_uv_project", True)
 async def test_uv_uninstall_in_project(mock_run: MagicMock):
     """Test UV uninstall uses remove subcommand when in UV project"""
-    mock_run.return_value = MagicMock(returncode=0)
+    mock_run.return_value = _mock_proc(0)
     mgr = UvPackageManager()
 
     result = await mgr.uninstall("package1 package2")
 
     mock_run.assert_called_once_with(
-        ["uv", "remove", "package1", "package2", "-p", PY_EXE],
+        "uv", "remove", "package1", "package2", "-p", PY_EXE
     )
     assert result is True
 
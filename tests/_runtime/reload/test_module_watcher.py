@@ -459,7 +459,10 @@ async def test_reload_with_modified_cell(
 
     # modify the first cell and make sure it is still marked as stale;
     k._maybe_register_cell(
-        er_1.cell_id, f"from {py_modname} import foo; 1", stale=False
+        er_1.cell_id,
+        f"from {py_modname} import foo; 1",
+        stale=False,
+        pending_import_namespaces=set(),
     )
     assert er_1.cell_id in k.graph.get_stale()
 
@@ -21,10 +21,12 @@ from marimo._runtime.packages.pypi_package_manager import (
 from marimo._runtime.packages.utils import is_python_isolated
 from marimo._runtime.requests import (
     ControlRequest,
+    ExecutionRequest,
     InstallMissingPackagesRequest,
 )
 from marimo._runtime.runner import cell_runner
-from tests.conftest import MockedKernel
+from marimo._types.ids import CellId_t
+from tests.conftest import ExecReqProvider, MockedKernel
 
 if TYPE_CHECKING:
     import pathlib
@@ -54,7 +56,14 @@ async def test_manage_script_metadata_uv(
         )
     )
     # Add marimo, skip os
-    k._maybe_register_cell("0", "import marimo as mo\nimport os", stale=False)
+    k.mutate_graph(
+        [
+            ExecutionRequest(
+                cell_id=CellId_t("0"), code="import marimo as mo\nimport os"
+            )
+        ],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         contents = f.read()
@@ -63,7 +72,10 @@ async def test_manage_script_metadata_uv(
         assert '"os",' not in contents
 
     # Add markdown
-    k._maybe_register_cell("1", "import markdown", stale=False)
+    k.mutate_graph(
+        [ExecutionRequest(cell_id=CellId_t("1"), code="import markdown")],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         contents = f.read()
@@ -72,7 +84,10 @@ async def test_manage_script_metadata_uv(
         assert '"markdown==' in contents
 
     # Remove marimo, it's still in requirements
-    k._maybe_register_cell("0", "import os", stale=False)
+    k.mutate_graph(
+        [ExecutionRequest(cell_id=CellId_t("0"), code="import os")],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         contents = f.read()
@@ -81,6 +96,35 @@ async def test_manage_script_metadata_uv(
         assert '"os",' not in contents
 
 
+def test_mutate_graph_updates_script_metadata_once(
+    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+) -> None:
+    k = mocked_kernel.k
+    callbacks = k.packages_callbacks
+    with (
+        patch.object(
+            callbacks, "should_update_script_metadata", return_value=True
+        ),
+        patch.object(callbacks, "update_script_metadata") as update,
+    ):
+        k.mutate_graph(
+            [
+                exec_req.get("import numpy\nimport os"),
+                exec_req.get("import pandas"),
+                exec_req.get("x = 1"),
+            ],
+            [],
+        )
+        update.assert_called_once_with(
+            import_namespaces_to_add=["numpy", "os", "pandas"]
+        )
+
+        # No newly imported namespaces, no update
+        update.reset_mock()
+        k.mutate_graph([exec_req.get("y = 1")], [])
+        update.assert_not_called()
+
+
 @pytest.mark.skipif(not HAS_UV, reason="uv not installed")
 async def test_manage_script_metadata_uv_deletion(
     tmp_path: pathlib.Path, mocked_kernel: MockedKernel
@@ -104,7 +148,14 @@ async def test_manage_script_metadata_uv_deletion(
     )
 
     # Add marimo, skip os
-    k._maybe_register_cell("0", "import marimo as mo\nimport os", stale=False)
+    k.mutate_graph(
+        [
+            ExecutionRequest(
+                cell_id=CellId_t("0"), code="import marimo as mo\nimport os"
+            )
+        ],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         contents = f.read()
@@ -112,7 +163,10 @@ async def test_manage_script_metadata_uv_deletion(
         assert '"os",' not in contents
 
     # Add markdown
-    k._maybe_register_cell("1", "import markdown", stale=False)
+    k.mutate_graph(
+        [ExecutionRequest(cell_id=CellId_t("1"), code="import markdown")],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         contents = f.read()
@@ -162,7 +216,14 @@ async def test_manage_script_metadata_uv_off(
     )
 
     # Add
-    k._maybe_register_cell("0", "import marimo as mo\nimport os", stale=False)
+    k.mutate_graph(
+        [
+            ExecutionRequest(
+                cell_id=CellId_t("0"), code="import marimo as mo\nimport os"
+            )
+        ],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         assert "" == f.read()
@@ -190,7 +251,14 @@ async def test_manage_script_metadata_uv_no_filename(
     )
 
     # Add
-    k._maybe_register_cell("0", "import marimo as mo\nimport os", stale=False)
+    k.mutate_graph(
+        [
+            ExecutionRequest(
+                cell_id=CellId_t("0"), code="import marimo as mo\nimport os"
+            )
+        ],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         assert "" == f.read()
@@ -218,7 +286,14 @@ async def test_manage_script_metadata_pip_noop(
     )
 
     # Add
-    k._maybe_register_cell("0", "import marimo as mo\nimport os", stale=False)
+    k.mutate_graph(
+        [
+            ExecutionRequest(
+                cell_id=CellId_t("0"), code="import marimo as mo\nimport os"
+            )
+        ],
+        [],
+    )
 
     with open(filename) as f:  # noqa: ASYNC230
         assert "" == f.read()
@@ -237,10 +312,9 @@ async def test_install_missing_packages_micropip(
                 versions={"barbaz": "", "foobar": ""},
             )
         )
-        assert mock_install.call_count == 2
+        assert mock_install.call_count == 1
         assert mock_install.call_args_list == [
-            call(["barbaz"]),
-            call(["foobar"]),
+            call(["barbaz", "foobar"]),
         ]
 
 
@@ -257,11 +331,39 @@ async def test_install_missing_packages_micropip_with_versions(
                 versions={"numpy": "1.22.0", "pandas": "1.5.0"},
             )
         )
-        assert mock_install.call_count == 2
+        assert mock_install.call_count == 1
+        assert mock_install.call_args_list == [
+            call(["numpy==1.22.0", "pandas==1.5.0"]),
+        ]
+
+
+@patch.dict(sys.modules, {"pyodide": Mock()})
+async def test_install_missing_packages_micropip_batch_failure(
+    mocked_kernel: MockedKernel,
+) -> None:
+    k = mocked_kernel.k
+
+    async def install(packages: list[str]) -> None:
+        if "broken" in packages:
+            raise ValueError("cannot install")
+
+    with patch(
+        "micropip.install", new_callable=AsyncMock, side_effect=install
+    ) as mock_install:
+        await k.packages_callbacks.install_missing_packages(
+            InstallMissingPackagesRequest(
+                manager="micropip",
+                versions={"broken": "", "numpy": ""},
+            )
+        )
+        # The failed batch is retried one package at a time
         assert mock_install.call_args_list == [
-            call(["numpy==1.22.0"]),
-            call(["pandas==1.5.0"]),
+            call(["broken", "numpy"]),
+            call(["broken"]),
+            call(["numpy"]),
         ]
+    assert "broken" in k.module_registry.excluded_modules
+    assert "numpy" not in k.module_registry.excluded_modules
 
 
 @patch.dict(sys.modules, {"pyodide": Mock(), "already_installed": Mock()})
@@ -281,10 +383,9 @@ async def test_install_missing_packages_micropip_other_modules(
                 versions={},
             )
         )
-        assert mock_install.call_count == 2
+        assert mock_install.call_count == 1
         assert mock_install.call_args_list == [
-            call(["done"]),
-            call(["idk"]),
+            call(["done", "idk"]),
         ]
 
 
@@ -400,9 +501,7 @@ async def test_missing_packages_hook(
         # Case 4: Already attempted packages should be filtered
         control_requests.clear()
         broadcast_messages.clear()
-        package_manager.attempted_to_install = (
-            lambda package: package == "numpy"
-        )  # type: ignore
+        package_manager._attempted_packages.add("numpy")
         k.packages_callbacks.missing_packages_hook(runner)
 
         # Should only include packages not yet attempted
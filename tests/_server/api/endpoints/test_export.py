@@ -1,11 +1,13 @@
 # Copyright 2024 Marimo. All rights reserved.
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +16,7 @@ from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.cell_output import CellChannel, CellOutput
 from marimo._messaging.ops import CellOp
 from marimo._output.utils import uri_encode_component
+from marimo._server.api.endpoints.export import _download_headers
 from marimo._types.ids import CellId_t, SessionId
 from marimo._utils.platform import is_windows
 from tests._server.conftest import get_session_manager
@@ -25,6 +28,8 @@ from tests._server.mocks import (
 from tests.mocks import snapshotter
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from starlette.testclient import TestClient
 
 snapshot = snapshotter(__file__)
@@ -37,6 +42,8 @@ HEADERS = {
 
 CODE = uri_encode_component("import marimo as mo")
 
+INDEX_HTML = "<html><head></head><body></body></html>"
+
 
 @with_session(SESSION_ID)
 def test_export_html(client: TestClient) -> None:
@@ -55,6 +62,20 @@ def test_export_html(client: TestClient) -> None:
     body = response.text
     assert '<marimo-code hidden=""></marimo-code>' not in body
     assert CODE in body
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("notebook.html", 'attachment; filename="notebook.html"'),
+        ("my notebook.py", "attachment; filename*=utf-8''my%20notebook.py"),
+        ('a"b.md', "attachment; filename*=utf-8''a%22b.md"),
+        ("café.html", "attachment; filename*=utf-8''caf%C3%A9.html"),
+    ],
+)
+def test_download_headers(filename: str, expected: str) -> None:
+    assert _download_headers(filename) == {"Content-Disposition": expected}
 
 
 @with_session(SESSION_ID)
@@ -162,6 +183,22 @@ def test_export_script(client: TestClient) -> None:
     )
     assert response.status_code == 200
     assert "__generated_with = " in response.text
+    assert "content-disposition" not in response.headers
+
+
+@with_session(SESSION_ID)
+def test_export_script_download(client: TestClient) -> None:
+    response = client.post(
+        "/api/export/script",
+        headers=HEADERS,
+        json={
+            "download": True,
+        },
+    )
+    assert response.status_code == 200
+    disposition = response.headers["content-disposition"]
+    assert disposition.startswith('attachment; filename="')
+    assert disposition.endswith('.script.py"')
 
 
 @pytest.mark.xfail(reason="flakey", strict=False)
@@ -225,7 +262,7 @@ def test_auto_export_html(client: TestClient, temp_marimo_file: str) -> None:
             "include_code": True,
         },
     )
-    assert response.status_code == 200
+    assert response.status_code == 202
     assert response.json() == {"success": True}
 
     response = client.post(
@@ -246,6 +283,113 @@ def test_auto_export_html(client: TestClient, temp_marimo_file: str) -> None:
     )
 
 
+@with_session(SESSION_ID)
+def test_auto_export_html_retried_after_failure(
+    client: TestClient, temp_marimo_file: str
+) -> None:
+    session = get_session_manager(client).get_session(SESSION_ID)
+    assert session
+    session.app_file_manager.filename = temp_marimo_file
+    session.session_view.add_operation(
+        CellOp(
+            cell_id=CellId_t("new_cell"),
+            output=CellOutput(
+                data="hello",
+                mimetype="text/plain",
+                channel=CellChannel.OUTPUT,
+            ),
+        )
+    )
+    body = {"download": False, "files": [], "include_code": True}
+
+    with patch(
+        "marimo._server.export.exporter.get_html_contents",
+        side_effect=[FileNotFoundError("index.html"), INDEX_HTML],
+    ) as get_html_contents:
+        # The export fails in the background; the view stays stale
+        response = client.post(
+            "/api/export/auto_export/html", headers=HEADERS, json=body
+        )
+        assert response.status_code == 202
+        assert session.session_view.needs_export("html")
+
+        # So the next request exports again
+        response = client.post(
+            "/api/export/auto_export/html", headers=HEADERS, json=body
+        )
+        assert response.status_code == 202
+        assert get_html_contents.call_count == 2
+
+        response = client.post(
+            "/api/export/auto_export/html", headers=HEADERS, json=body
+        )
+        assert response.status_code == 304
+
+    assert os.path.exists(
+        os.path.join(os.path.dirname(temp_marimo_file), "__marimo__")
+    )
+
+
+@with_session(SESSION_ID)
+def test_auto_export_html_while_pending(
+    client: TestClient, temp_marimo_file: str
+) -> None:
+    session = get_session_manager(client).get_session(SESSION_ID)
+    assert session
+    session.app_file_manager.filename = temp_marimo_file
+    session.session_view.add_operation(
+        CellOp(
+            cell_id=CellId_t("new_cell"),
+            output=CellOutput(
+                data="hello",
+                mimetype="text/plain",
+                channel=CellChannel.OUTPUT,
+            ),
+        )
+    )
+    body = {"download": False, "files": [], "include_code": True}
+
+    # Hold the background exports, as if they were still running
+    pending: list[Callable[[], Awaitable[None]]] = []
+
+    async def defer(
+        export: Callable[[], Awaitable[None]], export_type: str
+    ) -> None:
+        del export_type
+        pending.append(export)
+
+    with (
+        patch("marimo._server.api.endpoints.export._run_auto_export", defer),
+        patch(
+            "marimo._server.export.exporter.get_html_contents",
+            return_value=INDEX_HTML,
+        ),
+    ):
+        # The view is only marked once an export is saved, so back-to-back
+        # requests each schedule an export
+        for _ in range(2):
+            response = client.post(
+                "/api/export/auto_export/html", headers=HEADERS, json=body
+            )
+            assert response.status_code == 202
+        assert len(pending) == 2
+        assert session.session_view.needs_export("html")
+
+        for export in pending:
+            asyncio.run(export())
+
+        # Once saved, requests are not modified
+        response = client.post(
+            "/api/export/auto_export/html", headers=HEADERS, json=body
+        )
+        assert response.status_code == 304
+        assert len(pending) == 2
+
+    assert os.path.exists(
+        os.path.join(os.path.dirname(temp_marimo_file), "__marimo__")
+    )
+
+
 @with_session(SESSION_ID)
 def test_auto_export_html_no_code(
     client: TestClient, temp_marimo_file: str
@@ -270,7 +414,7 @@ def test_auto_export_html_no_code(
             "include_code": False,
         },
     )
-    assert response.status_code == 200
+    assert response.status_code == 202
     assert response.json() == {"success": True}
 
     response = client.post(
@@ -328,7 +472,7 @@ def test_auto_export_markdown(
             "download": False,
         },
     )
-    assert response.status_code == 200
+    assert response.status_code == 202
     assert response.json() == {"success": True}
 
     response = client.post(
@@ -365,7 +509,7 @@ def test_auto_export_ipynb(
             "download": False,
         },
     )
-    assert response.status_code == 200
+    assert response.status_code == 202
     assert response.json() == {"success": True}
 
     response = client.post(
@@ -464,7 +608,7 @@ def test_auto_export_ipynb_with_new_cell(
             "download": False,
         },
     )
-    assert export_response.status_code == 200
+    assert export_response.status_code == 202
     assert export_response.json() == {"success": True}
 
     # Verify the exported file exists
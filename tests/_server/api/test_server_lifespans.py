@@ -0,0 +1,118 @@
+# Copyright 2024 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from starlette.datastructures import State
+
+from marimo._server.api.lifespans import _startup_url, core, open_browser
+from marimo._server.model import SessionMode
+from marimo._server.tokens import AuthToken
+
+
+def _state(host: str, port: int = 2718) -> Mock:
+    state = Mock()
+    state.state = State()
+    state.host = host
+    state.port = port
+    state.base_url = ""
+    state.session_manager.auth_token = AuthToken("")
+    return state
+
+
+@pytest.mark.parametrize(
+    ("host", "expected"),
+    [
+        ("127.0.0.1", "http://localhost:2718"),
+        ("::1", "http://localhost:2718"),
+        ("localhost", "http://localhost:2718"),
+        ("0.0.0.0", "http://0.0.0.0:2718"),
+        ("192.168.0.2", "http://192.168.0.2:2718"),
+        ("example.com", "http://example.com:2718"),
+    ],
+)
+def test_startup_url_host(host: str, expected: str) -> None:
+    assert _startup_url(_state(host)) == expected
+
+
+def test_startup_url_port_and_token() -> None:
+    assert _startup_url(_state("127.0.0.1", port=443)) == "https://localhost"
+    state = _state("127.0.0.1")
+    state.session_manager.auth_token = AuthToken("secret")
+    assert _startup_url(state) == "http://localhost:2718?access_token=secret"
+
+
+def test_startup_url_computed_once() -> None:
+    state = _state("127.0.0.1")
+    assert _startup_url(state) == "http://localhost:2718"
+    state.port = 8000
+    assert _startup_url(state) == "http://localhost:2718"
+    assert state.state.startup_url == "http://localhost:2718"
+
+
+async def test_open_browser_off_event_loop() -> None:
+    state = _state("127.0.0.1")
+    state.headless = False
+    state.config_manager.get_config.return_value = {
+        "server": {"browser": "default"}
+    }
+    opened = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    calls: list[tuple[str, str, bool]] = []
+
+    def fake_open(browser: str, url: str) -> None:
+        calls.append(
+            (
+                browser,
+                url,
+                threading.current_thread() is threading.main_thread(),
+            )
+        )
+        loop.call_soon_threadsafe(opened.set)
+
+    with (
+        patch(
+            "marimo._server.api.lifespans.AppState.from_app",
+            return_value=state,
+        ),
+        patch("marimo._server.api.lifespans.open_url_in_browser", fake_open),
+    ):
+        async with open_browser(Mock()):
+            await asyncio.wait_for(opened.wait(), timeout=5)
+
+    assert calls == [("default", "http://localhost:2718", False)]
+
+
+@pytest.mark.parametrize(
+    ("mode", "starts_lsp"),
+    [(SessionMode.EDIT, True), (SessionMode.RUN, False)],
+)
+async def test_core_starts_lsp_only_in_edit_mode(
+    mode: SessionMode, starts_lsp: bool
+) -> None:
+    state = _state("127.0.0.1")
+    state.session_manager.mode = mode
+    state.session_manager.start_lsp_server = AsyncMock()
+
+    with (
+        patch(
+            "marimo._server.api.lifespans.AppState.from_app",
+            return_value=state,
+        ),
+        patch(
+            "marimo._server.api.lifespans.any_lsp_server_running",
+            return_value=True,
+        ),
+        patch(
+            "marimo._server.api.lifespans.initialize_mimetypes"
+        ) as init_mimetypes,
+    ):
+        async with core(Mock()):
+            pass
+
+    init_mimetypes.assert_called_once()
+    assert state.session_manager.start_lsp_server.called is starts_lsp
+    assert state.config_manager.get_config.called is starts_lsp
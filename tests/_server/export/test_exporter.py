@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import json
 import sys
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -19,16 +20,13 @@ from marimo._server.export import (
     run_app_then_export_as_ipynb,
     run_app_until_completion,
 )
-from marimo._server.export.exporter import Exporter
+from marimo._server.export.exporter import AutoExporter, Exporter
 from marimo._server.file_manager import AppFileManager
 from marimo._server.models.export import ExportAsHTMLRequest
 from marimo._server.session.session_view import SessionView
 from marimo._utils.marimo_path import MarimoPath
 from tests.mocks import snapshotter
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 snapshot = snapshotter(__file__)
 
 HAS_NBFORMAT = DependencyManager.nbformat.has()
@@ -924,3 +922,63 @@ def test_export_as_html_code_hash_consistency():
     assert '"code": "return' in html_with_code, (
         "Cell code should be present when include_code=True"
     )
+
+
+async def test_auto_exporter_skips_unchanged_content(tmp_path: Path):
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text("")
+    exporter = AutoExporter()
+    exported = tmp_path / AutoExporter.EXPORT_DIR / "notebook.html"
+
+    await exporter.save_html(str(notebook), "<html></html>")
+    assert exported.read_text() == "<html></html>"
+
+    # Identical content is not written again
+    with patch.object(Path, "write_text") as mock_write:
+        await exporter.save_html(str(notebook), "<html></html>")
+    mock_write.assert_not_called()
+
+    # A removed export is written again
+    exported.unlink()
+    await exporter.save_html(str(notebook), "<html></html>")
+    assert exported.read_text() == "<html></html>"
+
+    await exporter.save_html(str(notebook), "<html>new</html>")
+    assert exported.read_text() == "<html>new</html>"
+    exporter.cleanup()
+
+
+async def test_auto_exporter_missing_directory(tmp_path: Path):
+    exporter = AutoExporter()
+    with pytest.raises(FileNotFoundError):
+        await exporter.save_md(str(tmp_path / "missing" / "nb.py"), "# nb")
+    exporter.cleanup()
+
+
+async def test_export_as_html_async_matches_sync():
+    app = App()
+
+    @app.cell()
+    def test_cell():
+        x = 1
+        return (x,)
+
+    file_manager = AppFileManager.from_app(InternalApp(app))
+    session_view = SessionView()
+    request = ExportAsHTMLRequest(download=False, files=[], include_code=True)
+    kwargs: dict[str, Any] = {
+        "filename": file_manager.filename,
+        "app": file_manager.app,
+        "session_view": session_view,
+        "display_config": DEFAULT_CONFIG["display"],
+        "request": request,
+    }
+
+    with patch(
+        "marimo._server.export.exporter.get_html_contents",
+        return_value="<html><head></head><body></body></html>",
+    ):
+        exporter = Exporter()
+        assert await exporter.export_as_html_async(
+            **kwargs
+        ) == exporter.export_as_html(**kwargs)
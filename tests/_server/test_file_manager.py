@@ -509,6 +509,65 @@ def test_rename_with_special_chars(app_file_manager: AppFileManager) -> None:
         shutil.rmtree(temp_dir)
 
 
+def test_reload_skips_unchanged_file(tmp_path: Path) -> None:
+    tmp_file = tmp_path / "test.py"
+    tmp_file.write_text(
+        """
+import marimo
+
+app = marimo.App()
+
+@app.cell
+def cell1():
+    x = 1
+    return x
+"""
+    )
+    manager = AppFileManager(tmp_file)
+    app = manager.app
+
+    # Nothing changed on disk, so the app is not re-parsed
+    assert manager.reload() == set()
+    assert manager.app is app
+
+    # Unsaved in-memory edits are still discarded by a reload
+    manager.save(
+        SaveNotebookRequest(
+            cell_ids=[CellId_t("Hbol")],
+            codes=["x = 2"],
+            names=["cell1"],
+            configs=[CellConfig()],
+            filename=str(tmp_file),
+            persist=False,
+        )
+    )
+    assert manager.reload() == {"Hbol"}
+    assert manager.app.cell_manager.get_cell_code("Hbol") == "x = 1"
+
+
+def test_reload_retries_after_failed_load(tmp_path: Path) -> None:
+    tmp_file = tmp_path / "test.py"
+    valid = """
+import marimo
+
+app = marimo.App()
+
+@app.cell
+def cell1():
+    x = 1
+    return x
+"""
+    tmp_file.write_text(valid)
+    manager = AppFileManager(tmp_file)
+
+    tmp_file.write_text(valid + "\ndef broken(:\n")
+    with pytest.raises(SyntaxError):
+        manager.reload()
+    # The failed load isn't remembered, so the file is parsed again
+    with pytest.raises(SyntaxError):
+        manager.reload()
+
+
 def test_reload_reinitializes_graph(tmp_path: Path) -> None:
     """Test that reload() properly reinitializes the graph with new cells."""
     # Create a temporary file